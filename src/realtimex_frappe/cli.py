@@ -1,16 +1,100 @@
 """CLI entry point for realtimex-frappe."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from . import __version__
-from .config.loader import load_config, write_default_config
-from .utils.environment import get_binary_path, validate_binaries
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console, created on first use.
+
+    Rich is imported lazily so that lightweight invocations such as
+    ``--version`` and ``--help`` don't pay its import cost.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+# Status cells for the binary table in `validate`
+_STATUS_FOUND = "[green]✓ Found[/green]"
+_STATUS_MISSING_REQUIRED = "[red]✗ Missing (required)[/red]"
+_STATUS_MISSING_OPTIONAL = "[yellow]⚠ Missing (optional)[/yellow]"
+_PATH_MISSING = "[dim]-[/dim]"
+
+
+def _binary_status(path: Optional[str], is_required: bool) -> str:
+    """Get the status cell for a binary in the validation table."""
+    if path:
+        return _STATUS_FOUND
+    return _STATUS_MISSING_REQUIRED if is_required else _STATUS_MISSING_OPTIONAL
+
+
+def _add_options(options: list[click.Option]):
+    """Attach a prebuilt list of click options to a command function.
+
+    Options are shown in list order in --help, just like a stack of
+    @click.option decorators written in the same order.
+    """
+
+    def decorator(f):
+        if not hasattr(f, "__click_params__"):
+            f.__click_params__ = []
+        # click reverses decorator-collected params, so append in reverse
+        f.__click_params__.extend(reversed(options))
+        return f
+
+    return decorator
+
+
+NEW_SITE_OPTIONS = [
+    click.Option(
+        ["--config", "-c"],
+        type=click.Path(exists=True),
+        help="Path to configuration JSON file.",
+    ),
+    click.Option(
+        ["--site-name"],
+        help="Name for the new site (e.g., mysite.localhost).",
+    ),
+    click.Option(
+        ["--admin-password"],
+        help="Administrator password for the site.",
+    ),
+    click.Option(
+        ["--db-host"],
+        help="PostgreSQL host (e.g., localhost or db.xxx.supabase.co).",
+    ),
+    click.Option(
+        ["--db-port"],
+        type=int,
+        help="PostgreSQL port.",
+    ),
+    click.Option(
+        ["--db-name"],
+        help="PostgreSQL database name.",
+    ),
+    click.Option(
+        ["--db-user"],
+        help="PostgreSQL username.",
+    ),
+    click.Option(
+        ["--db-password"],
+        help="PostgreSQL password.",
+    ),
+    click.Option(
+        ["--bench-path"],
+        help="Path for the bench installation (default: from --config, else ./frappe-bench).",
+    ),
+]
+"""Options for the new-site command, built once at import."""
 
 
 @click.group()
@@ -43,6 +127,9 @@ def init_config(output: str):
     """
     from pathlib import Path
 
+    from .config.loader import write_default_config
+
+    console = _console()
     path = Path(output)
 
     if path.exists():
@@ -51,12 +138,14 @@ def init_config(output: str):
             return
 
     write_default_config(output)
-    console.print(f"[green]✓[/green] Configuration file created at: [cyan]{output}[/cyan]")
-    console.print("\n[dim]Edit this file to configure:[/dim]")
-    console.print("  • Database credentials (PostgreSQL/Supabase)")
-    console.print("  • Bundled binary paths (Node.js, wkhtmltopdf)")
-    console.print("  • Apps to install (ERPNext, custom apps)")
-    console.print("  • Redis connection settings")
+    console.print("\n".join([
+        f"[green]✓[/green] Configuration file created at: [cyan]{output}[/cyan]",
+        "\n[dim]Edit this file to configure:[/dim]",
+        "  • Database credentials (PostgreSQL/Supabase)",
+        "  • Bundled binary paths (Node.js, wkhtmltopdf)",
+        "  • Apps to install (ERPNext, custom apps)",
+        "  • Redis connection settings",
+    ]))
 
 
 @main.command("validate")
@@ -78,6 +167,12 @@ def validate_config(config: str):
     Example:
         realtimex-frappe validate --config ./my-config.json
     """
+    from rich.table import Table
+
+    from .config.loader import load_config
+    from .utils.environment import BinaryValidationResult, resolve_binaries
+
+    console = _console()
     console.print("[bold]Validating configuration...[/bold]\n")
 
     # Load config
@@ -89,11 +184,14 @@ def validate_config(config: str):
         raise click.Abort()
 
     # Show config summary
-    console.print("\n[bold]Configuration Summary:[/bold]")
-    console.print(f"  Frappe branch: [cyan]{cfg.frappe.branch}[/cyan]")
-    console.print(f"  Apps to install: [cyan]{len(cfg.apps)}[/cyan]")
-    console.print(f"  Database type: [cyan]{cfg.database.type}[/cyan]")
-    console.print(f"  Redis URL: [cyan]{cfg.redis.url}[/cyan]")
+    console.print("\n".join([
+        "\n[bold]Configuration Summary:[/bold]",
+        f"  Frappe branch: [cyan]{cfg.frappe.branch}[/cyan]",
+        f"  Apps to install: [cyan]{len(cfg.apps)}[/cyan]",
+        f"  Database type: [cyan]{cfg.database.type}[/cyan]",
+        f"  Redis cache URL: [cyan]{cfg.redis.cache_url}[/cyan]",
+        f"  Redis queue URL: [cyan]{cfg.redis.queue_url}[/cyan]",
+    ]))
 
     # Check binaries
     console.print("\n[bold]Checking binaries...[/bold]")
@@ -101,106 +199,51 @@ def validate_config(config: str):
     required_binaries = ["node", "npm"]
     optional_binaries = ["yarn", "wkhtmltopdf"]
 
+    # Resolve everything up front so table rendering does no I/O
+    all_binaries = required_binaries + optional_binaries
+    paths = resolve_binaries(cfg, all_binaries)
+
     # Create a table for binary status
     table = Table(show_header=True, header_style="bold")
     table.add_column("Binary")
     table.add_column("Status")
     table.add_column("Path")
 
-    all_binaries = required_binaries + optional_binaries
-
     for binary in all_binaries:
-        path = get_binary_path(binary, cfg)
-        is_required = binary in required_binaries
-
-        if path:
-            status = "[green]✓ Found[/green]"
-            path_display = f"[dim]{path}[/dim]"
-        else:
-            if is_required:
-                status = "[red]✗ Missing (required)[/red]"
-            else:
-                status = "[yellow]⚠ Missing (optional)[/yellow]"
-            path_display = "[dim]-[/dim]"
-
-        table.add_row(binary, status, path_display)
+        path = paths[binary]
+        table.add_row(
+            binary,
+            _binary_status(path, binary in required_binaries),
+            f"[dim]{path}[/dim]" if path else _PATH_MISSING,
+        )
 
     console.print(table)
 
     # Final result
-    result = validate_binaries(cfg, required_binaries)
+    result = BinaryValidationResult.from_paths(paths, required_binaries)
     if result.is_valid:
         console.print("\n[green]✓ All required binaries found[/green]")
     else:
-        console.print(f"\n[red]✗ Missing required binaries: {', '.join(result.missing)}[/red]")
-        console.print("\n[yellow]Hint: Configure binary paths in your config file:[/yellow]")
-        console.print('[dim]  "binaries": { "node": { "bin_dir": "/path/to/node/bin" } }[/dim]')
+        console.print("\n".join([
+            f"\n[red]✗ Missing required binaries: {', '.join(result.missing)}[/red]",
+            "\n[yellow]Hint: Configure binary paths in your config file:[/yellow]",
+            '[dim]  "binaries": { "node": { "bin_dir": "/path/to/node/bin" } }[/dim]',
+        ]))
         raise click.Abort()
 
 
 @main.command("new-site")
-@click.option(
-    "--config",
-    "-c",
-    type=click.Path(exists=True),
-    help="Path to configuration JSON file.",
-)
-@click.option(
-    "--site-name",
-    prompt="Site name",
-    help="Name for the new site (e.g., mysite.localhost).",
-)
-@click.option(
-    "--admin-password",
-    prompt="Admin password",
-    hide_input=True,
-    confirmation_prompt=True,
-    help="Administrator password for the site.",
-)
-@click.option(
-    "--db-host",
-    prompt="Database host",
-    default="localhost",
-    help="PostgreSQL host (e.g., localhost or db.xxx.supabase.co).",
-)
-@click.option(
-    "--db-port",
-    prompt="Database port",
-    default=5432,
-    type=int,
-    help="PostgreSQL port.",
-)
-@click.option(
-    "--db-name",
-    prompt="Database name",
-    help="PostgreSQL database name.",
-)
-@click.option(
-    "--db-user",
-    prompt="Database user",
-    help="PostgreSQL username.",
-)
-@click.option(
-    "--db-password",
-    prompt="Database password",
-    hide_input=True,
-    help="PostgreSQL password.",
-)
-@click.option(
-    "--bench-path",
-    default="./frappe-bench",
-    help="Path for the bench installation.",
-)
+@_add_options(NEW_SITE_OPTIONS)
 def new_site(
     config: Optional[str],
-    site_name: str,
-    admin_password: str,
-    db_host: str,
-    db_port: int,
-    db_name: str,
-    db_user: str,
-    db_password: str,
-    bench_path: str,
+    site_name: Optional[str],
+    admin_password: Optional[str],
+    db_host: Optional[str],
+    db_port: Optional[int],
+    db_name: Optional[str],
+    db_user: Optional[str],
+    db_password: Optional[str],
+    bench_path: Optional[str],
 ):
     """Create a new Frappe site with ERPNext.
 
@@ -210,13 +253,40 @@ def new_site(
     3. Create a new Frappe site
     4. Install ERPNext and any other configured apps
 
+    Values not given as options are taken from --config; anything still
+    missing is prompted for, so a complete config runs non-interactively.
+    Without --config, the database host and port are prompted for and the
+    bench goes in ./frappe-bench, as before.
+
     Example:
         realtimex-frappe new-site --config ./my-config.json
     """
     from .commands.new_site import create_new_site
+    from .config.loader import get_default_config, load_config
+
+    try:
+        base = load_config(config) if config else get_default_config()
+    except Exception as e:
+        _console().print(f"[red]✗ Failed to load config: {e}[/red]")
+        raise click.Abort()
+
+    # Prompt only for required values that neither options nor config supply
+    site_name = site_name or base.site.name or click.prompt("Site name")
+    admin_password = admin_password or base.site.site_password or click.prompt(
+        "Admin password", hide_input=True, confirmation_prompt=True
+    )
+    if not config:
+        db_host = db_host or click.prompt("Database host", default=base.database.host)
+        db_port = db_port or click.prompt("Database port", default=base.database.port, type=int)
+        bench_path = bench_path or "./frappe-bench"
+    db_name = db_name or base.database.name or click.prompt("Database name")
+    db_user = db_user or base.database.user or click.prompt("Database user")
+    db_password = db_password or base.database.password or click.prompt(
+        "Database password", hide_input=True
+    )
 
     success = create_new_site(
-        config_path=config,
+        config=base,
         site_name=site_name,
         admin_password=admin_password,
         db_host=db_host,
@@ -303,6 +373,7 @@ def env_help():
     """
     from .config.env import print_env_var_help
 
+    console = _console()
     console.print("[bold]Environment Variables for 'realtimex-frappe run'[/bold]\n")
     print_env_var_help()
     console.print("\n[dim]Example usage:[/dim]")
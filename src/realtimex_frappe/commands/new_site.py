@@ -6,7 +6,7 @@ from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
 
-from ..config.loader import load_config, merge_config_with_cli
+from ..config.loader import merge_config_with_cli
 from ..config.schema import RealtimexConfig
 from ..utils.bench import (
     bench_exists,
@@ -15,13 +15,13 @@ from ..utils.bench import (
     install_all_apps,
     update_common_site_config,
 )
-from ..utils.environment import validate_binaries
+from ..utils.environment import validate_binaries_bulk
 
 console = Console()
 
 
 def create_new_site(
-    config_path: Optional[str] = None,
+    config: Optional[RealtimexConfig] = None,
     site_name: Optional[str] = None,
     admin_password: Optional[str] = None,
     db_host: Optional[str] = None,
@@ -34,7 +34,7 @@ def create_new_site(
     """Create a new Frappe site with all configured apps.
 
     This orchestrates the full site creation flow:
-    1. Load and merge configuration
+    1. Merge configuration with CLI options
     2. Validate required binaries
     3. Initialize bench (if needed)
     4. Update common_site_config.json
@@ -42,7 +42,7 @@ def create_new_site(
     6. Install all configured apps
 
     Args:
-        config_path: Path to the configuration JSON file.
+        config: Base configuration, already loaded (defaults if None).
         site_name: Site name (overrides config).
         admin_password: Admin password (overrides config).
         db_host: Database host (overrides config).
@@ -57,23 +57,13 @@ def create_new_site(
     """
     console.print(Panel.fit("🚀 Realtimex Frappe - New Site Setup", style="bold blue"))
 
-    # Step 1: Load configuration
+    # Step 1: Merge configuration
     console.print("\n[bold]Step 1:[/bold] Loading configuration...")
 
-    config: Optional[RealtimexConfig] = None
-    if config_path:
-        try:
-            config = load_config(config_path)
-            console.print(f"[green]✓[/green] Loaded config from {config_path}")
-        except Exception as e:
-            console.print(f"[red]✗ Failed to load config: {e}[/red]")
-            return False
-
-    # Merge with CLI options
     config = merge_config_with_cli(
         config,
         site_name=site_name,
-        admin_password=admin_password,
+        site_password=admin_password,
         db_host=db_host,
         db_port=db_port,
         db_name=db_name,
@@ -87,7 +77,7 @@ def create_new_site(
         console.print("[red]✗ Site name is required[/red]")
         return False
 
-    if not config.site.admin_password:
+    if not config.site.site_password:
         console.print("[red]✗ Admin password is required[/red]")
         return False
 
@@ -95,9 +85,11 @@ def create_new_site(
         console.print("[red]✗ Database name is required[/red]")
         return False
 
-    console.print(f"  Site: [cyan]{config.site.name}[/cyan]")
-    console.print(f"  Bench: [cyan]{config.bench.path}[/cyan]")
-    console.print(f"  Database: [cyan]{config.database.host}:{config.database.port}/{config.database.name}[/cyan]")
+    console.print("\n".join([
+        f"  Site: [cyan]{config.site.name}[/cyan]",
+        f"  Bench: [cyan]{config.bench.path}[/cyan]",
+        f"  Database: [cyan]{config.database.host}:{config.database.port}/{config.database.name}[/cyan]",
+    ]))
 
     # Step 2: Validate binaries
     console.print("\n[bold]Step 2:[/bold] Validating binaries...")
@@ -107,7 +99,7 @@ def create_new_site(
     required = ["node", "npm"]
     optional = ["yarn", "wkhtmltopdf"]
 
-    result = validate_binaries(config, required)
+    result, opt_result = validate_binaries_bulk(config, required, optional)
     if not result.is_valid:
         console.print(f"[red]✗ Missing required binaries: {', '.join(result.missing)}[/red]")
         console.print("\n[yellow]Hint: Configure binary paths in your config file:[/yellow]")
@@ -116,8 +108,7 @@ def create_new_site(
 
     console.print(f"[green]✓[/green] Required binaries available: {', '.join(result.available)}")
 
-    # Check optional binaries
-    opt_result = validate_binaries(config, optional)
+    # Report optional binaries
     if opt_result.missing:
         console.print(f"[yellow]⚠[/yellow] Optional binaries missing: {', '.join(opt_result.missing)}")
     if opt_result.available:
@@ -163,9 +154,11 @@ def create_new_site(
     # Success!
     console.print("\n" + "=" * 50)
     console.print(Panel.fit("✅ Site created successfully!", style="bold green"))
-    console.print("\n[bold]Next steps:[/bold]")
-    console.print(f"  1. cd {config.bench.path}")
-    console.print("  2. bench start")
-    console.print(f"  3. Open http://{config.site.name}:8000")
+    console.print("\n".join([
+        "\n[bold]Next steps:[/bold]",
+        f"  1. cd {config.bench.path}",
+        "  2. bench start",
+        f"  3. Open http://{config.site.name}:{config.bench.port}",
+    ]))
 
     return True
@@ -1,11 +1,8 @@
 """Run command - unified setup and start for production use."""
 
-import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from rich.console import Console
-from rich.panel import Panel
+from typing import TYPE_CHECKING, Optional
 
 from ..config.env import (
     config_from_environment,
@@ -23,60 +20,42 @@ from ..utils.bench import (
     run_bench_start_subprocess,
     site_exists,
     site_is_healthy,
+    site_missing_apps,
     start_bench,
+    stop_bench_subprocess,
     update_common_site_config,
+    wait_for_bench_ready,
 )
 from ..utils.environment import (
+    VALIDATION_STAMP_FILE,
     get_prerequisite_install_hint,
     validate_all_prerequisites,
-    validate_system_prerequisites,
 )
 from ..utils.paths import ensure_bench_directory
 
-console = Console()
-
-
-def wait_for_bench_ready(port: int = 8000, timeout: int = 60) -> bool:
-    """Wait for bench to be ready (web server available on specified port).
-
-    Args:
-        port: The port to check for webserver availability.
-        timeout: Maximum seconds to wait.
-
-    Returns:
-        True if bench is ready, False if timeout.
-    """
-    import socket
+if TYPE_CHECKING:
+    from rich.console import Console
 
-    start_time = time.time()
 
-    while time.time() - start_time < timeout:
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(("127.0.0.1", port))
-            sock.close()
-            if result == 0:
-                return True
-        except Exception:
-            pass
-        time.sleep(2)
-        console.print("[dim]Waiting for bench to be ready...[/dim]")
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console, created on first use."""
+    from rich.console import Console
 
-    return False
+    return Console()
 
 
 def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
     """Set up a new Frappe site and start the server.
 
     This command handles the full setup flow:
-    1. Validates system prerequisites (git, pkg-config, wkhtmltopdf)
-    2. Reads configuration from environment variables
+    1. Reads configuration from environment variables
+    2. Validates system prerequisites (git, pkg-config, wkhtmltopdf)
     3. Validates bundled binaries (node, npm)
     4. Initializes bench (if needed)
     5. Gets apps (clone repositories)
     6. Creates the site (if needed)
-    7. Starts bench temporarily for app installation
+    7. Starts bench temporarily if the site is missing apps
     8. Installs apps on site (requires Redis to be running)
     9. Starts the bench server for production
 
@@ -84,25 +63,12 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
         config: Optional pre-loaded configuration. If not provided,
             configuration is read from environment variables.
     """
-    console.print(Panel.fit("🚀 Realtimex Frappe", style="bold blue"))
-
-    # Step 1: Validate system prerequisites
-    console.print("\n[bold]Checking system prerequisites...[/bold]")
-
-    prereq_result = validate_system_prerequisites()
-    if not prereq_result.is_valid:
-        console.print("[red]✗ Missing required system prerequisites:[/red]")
-        for binary in prereq_result.missing_required:
-            hint = get_prerequisite_install_hint(binary)
-            console.print(f"  [red]•[/red] {binary}")
-            if hint:
-                console.print(f"    [dim]Install: {hint}[/dim]")
-        console.print("\n[yellow]Please install the missing prerequisites and try again.[/yellow]")
-        raise SystemExit(1)
+    from rich.panel import Panel
 
-    console.print(f"[green]✓[/green] System prerequisites: {', '.join(prereq_result.available)}")
+    console = _console()
+    console.print(Panel.fit("🚀 Realtimex Frappe", style="bold blue"))
 
-    # Step 2: Load configuration from environment
+    # Step 1: Load configuration from environment
     console.print("\n[bold]Loading configuration...[/bold]")
 
     if config is None:
@@ -115,17 +81,40 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
             print_env_var_help()
             raise SystemExit(1)
 
-        config = config_from_environment()
+        try:
+            config = config_from_environment()
+        except ValueError as e:
+            console.print(f"[red]✗ {e}[/red]")
+            raise SystemExit(1)
+
+    console.print("\n".join([
+        f"  Mode: [cyan]{config.mode.value}[/cyan]",
+        f"  Site: [cyan]{config.site.name}[/cyan]",
+        f"  Bench: [cyan]{config.bench.path}[/cyan]",
+        f"  Database: [cyan]{config.database.host}:{config.database.port}/{config.database.name}[/cyan]",
+    ]))
+
+    # Step 2: Validate system prerequisites and bundled binaries in one pass
+    console.print("\n[bold]Checking system prerequisites...[/bold]")
+
+    # Reuses the previous run's findings if config, PATH and binaries are unchanged
+    stamp_file = Path(config.bench.path) / VALIDATION_STAMP_FILE
+    prereq_result, binaries_result = validate_all_prerequisites(config, stamp_file)
+    if not prereq_result.is_valid:
+        console.print("[red]✗ Missing required system prerequisites:[/red]")
+        for binary in prereq_result.missing_required:
+            hint = get_prerequisite_install_hint(binary)
+            console.print(f"  [red]•[/red] {binary}")
+            if hint:
+                console.print(f"    [dim]Install: {hint}[/dim]")
+        console.print("\n[yellow]Please install the missing prerequisites and try again.[/yellow]")
+        raise SystemExit(1)
 
-    console.print(f"  Mode: [cyan]{config.mode.value}[/cyan]")
-    console.print(f"  Site: [cyan]{config.site.name}[/cyan]")
-    console.print(f"  Bench: [cyan]{config.bench.path}[/cyan]")
-    console.print(f"  Database: [cyan]{config.database.host}:{config.database.port}/{config.database.name}[/cyan]")
+    console.print(f"[green]✓[/green] System prerequisites: {', '.join(prereq_result.available)}")
 
     # Step 3: Validate bundled binaries
     console.print("\n[bold]Validating bundled binaries...[/bold]")
 
-    _, binaries_result = validate_all_prerequisites(config)
     if not binaries_result.is_valid:
         console.print(f"[red]✗ Missing required binaries: {', '.join(binaries_result.missing)}[/red]")
         console.print("\n[yellow]Set REALTIMEX_NODE_BIN_DIR to the path of your Node.js bin directory.[/yellow]")
@@ -136,6 +125,7 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
     # Step 4: Initialize bench (if needed)
     console.print("\n[bold]Setting up bench...[/bold]")
 
+    bench_created = False
     if bench_exists(config):
         console.print(f"[green]✓[/green] Using existing bench at {config.bench.path}")
     else:
@@ -145,6 +135,7 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
             console.print("[red]✗ Failed to initialize bench[/red]")
             raise SystemExit(1)
         console.print("[green]✓[/green] Bench initialized")
+        bench_created = True
 
     # User mode: initialize locally and connect to existing DB
     if config.mode == RunMode.USER:
@@ -189,9 +180,12 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
 
     # Step 7: Create site (if needed) or repair if in partial state
     console.print("\n[bold]Setting up site...[/bold]")
-    needs_app_install = False
 
-    healthy, reason = site_is_healthy(config)
+    # A bench we just initialized cannot contain the site yet
+    if bench_created:
+        healthy, reason = False, "not_found"
+    else:
+        healthy, reason = site_is_healthy(config)
 
     if healthy:
         console.print(f"[green]✓[/green] Site {config.site.name} is healthy")
@@ -202,7 +196,6 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
             console.print("[red]✗ Failed to create site[/red]")
             raise SystemExit(1)
         console.print(f"[green]✓[/green] Site created")
-        needs_app_install = True
     else:
         # Partial state detected - repair with --force
         console.print(f"[yellow]⚠[/yellow] Site in partial state ({reason}), repairing...")
@@ -210,10 +203,12 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
             console.print("[red]✗ Failed to repair site[/red]")
             raise SystemExit(1)
         console.print(f"[green]✓[/green] Site repaired")
-        needs_app_install = True
 
     # Step 8: Install apps (requires bench to be running for after_install hooks)
-    if needs_app_install and config.apps:
+    # Skip the throwaway bench entirely when the site already has every app,
+    # e.g. on a restart or after a run that stopped midway through installing
+    missing_apps = site_missing_apps(config)
+    if missing_apps:
         console.print("\n[bold]Installing apps...[/bold]")
         console.print("[dim]Starting bench temporarily for app installation (Redis required)...[/dim]")
 
@@ -222,17 +217,15 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
 
         try:
             # Wait for bench to be ready
-            if not wait_for_bench_ready(port=config.bench.port, timeout=120):
-                console.print("[red]✗ Timeout waiting for bench to start[/red]")
-                bench_process.terminate()
+            if not wait_for_bench_ready(port=config.bench.port, timeout=120, process=bench_process):
+                console.print("[red]✗ Bench did not become ready[/red]")
                 raise SystemExit(1)
 
             console.print("[green]✓[/green] Bench is ready")
 
             # Install apps
-            if not install_apps_on_site(config):
+            if not install_apps_on_site(config, missing_apps):
                 console.print("[red]✗ Failed to install apps[/red]")
-                bench_process.terminate()
                 raise SystemExit(1)
 
             console.print("[green]✓[/green] Apps installed")
@@ -240,11 +233,7 @@ def run_setup_and_start(config: Optional[RealtimexConfig] = None) -> None:
         finally:
             # Stop the temporary bench process
             console.print("[dim]Stopping temporary bench...[/dim]")
-            bench_process.terminate()
-            try:
-                bench_process.wait(timeout=10)
-            except Exception:
-                bench_process.kill()
+            stop_bench_subprocess(bench_process)
 
     # Step 9: Start the bench server (final - replaces current process)
     console.print("\n" + "=" * 50)
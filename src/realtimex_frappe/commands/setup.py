@@ -13,12 +13,19 @@ Orchestrates complete site setup:
 10. Output team credentials
 """
 
+import shutil
+from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
-
 from ..config.env import (
+    ENV_DB_HOST,
+    ENV_DB_NAME,
+    ENV_DB_PASSWORD,
+    ENV_DB_PORT,
+    ENV_DB_SCHEMA,
+    ENV_DB_USER,
+    ENV_MODE,
+    ENV_SITE_NAME,
     config_from_environment,
     get_missing_required_env_vars,
     print_env_var_help,
@@ -33,17 +40,16 @@ from ..utils.bench import (
     run_bench_start_subprocess,
     site_exists,
     site_is_healthy,
+    stop_bench_subprocess,
     update_common_site_config,
+    wait_for_bench_ready,
 )
-
 from ..utils.environment import (
     get_prerequisite_install_hint,
     validate_all_prerequisites,
 )
 from ..utils.paths import ensure_bench_directory
 
-console = Console()
-
 
 def run_setup(config: Optional[RealtimexConfig] = None) -> None:
     """Run administrator setup to create a new site.
@@ -60,6 +66,11 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
     Raises:
         SystemExit: On validation or setup failures.
     """
+    # Only the setup path needs rich; keep it off other commands' startup
+    from rich.console import Console
+    from rich.panel import Panel
+
+    console = Console()
     console.print(
         Panel.fit("🔧 Realtimex Frappe Setup", style="bold blue")
     )
@@ -72,14 +83,22 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
     if config is None:
         missing = get_missing_required_env_vars()
         if missing:
-            console.print("[red]✗ Missing required settings:[/red]")
-            for var in missing:
-                console.print(f"  • {var}")
-            console.print("\n[dim]Run 'realtimex-frappe env-help' for details[/dim]")
+            console.print("\n".join([
+                "[red]✗ Missing required settings:[/red]",
+                *(f"  • {var}" for var in missing),
+                "\n[dim]Run 'realtimex-frappe env-help' for details[/dim]",
+            ]))
             print_env_var_help()
             raise SystemExit(1)
 
-        config = config_from_environment()
+        try:
+            config = config_from_environment()
+        except ValueError as e:
+            console.print(f"[red]✗ {e}[/red]")
+            raise SystemExit(1)
+
+    db = config.database
+    site = config.site
 
     # Mode validation
     if config.mode != RunMode.ADMIN:
@@ -87,20 +106,22 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
         raise SystemExit(1)
 
     # Schema validation
-    if not config.database.schema:
+    if not db.schema:
         console.print("[red]✗ Setup requires REALTIMEX_DB_SCHEMA[/red]")
         raise SystemExit(1)
 
     # Admin credentials validation
-    if not config.database.admin_user or not config.database.admin_password:
+    if not db.admin_user or not db.admin_password:
         console.print("[red]✗ Setup requires admin database credentials[/red]")
         console.print("[dim]Set REALTIMEX_ADMIN_DB_USER and REALTIMEX_ADMIN_DB_PASSWORD[/dim]")
         raise SystemExit(1)
 
-    console.print("[green]✓[/green] All required settings found")
-    console.print(f"  Site: [cyan]{config.site.name}[/cyan]")
-    console.print(f"  Database: [cyan]{config.database.host}[/cyan]")
-    console.print(f"  Schema: [cyan]{config.database.schema}[/cyan]")
+    console.print("\n".join([
+        "[green]✓[/green] All required settings found",
+        f"  Site: [cyan]{site.name}[/cyan]",
+        f"  Database: [cyan]{db.host}[/cyan]",
+        f"  Schema: [cyan]{db.schema}[/cyan]",
+    ]))
 
     # ─────────────────────────────────────────────────────────────────────────
     # Step 2: Check system requirements
@@ -110,8 +131,8 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
     prereqs, binaries = validate_all_prerequisites(config)
 
     if not prereqs.is_valid:
-        console.print(f"[red]✗ Missing: {', '.join(prereqs.missing)}[/red]")
-        for prereq in prereqs.missing:
+        console.print(f"[red]✗ Missing: {', '.join(prereqs.missing_required)}[/red]")
+        for prereq in prereqs.missing_required:
             hint = get_prerequisite_install_hint(prereq)
             if hint:
                 console.print(f"  [dim]{prereq}: {hint}[/dim]")
@@ -127,9 +148,6 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
     # ─────────────────────────────────────────────────────────────────────────
     # Step 3: Check for existing installation
     # ─────────────────────────────────────────────────────────────────────────
-    from pathlib import Path
-    import shutil
-
     bench_path = Path(config.bench.path)
 
     if bench_path.exists():
@@ -143,14 +161,16 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
                 raise SystemExit(1)
         elif site_exists(config):
             # Site exists - check if it's healthy
-            console.print(f"\n[yellow]Existing installation found at {bench_path}[/yellow]")
-            console.print(f"  Site '{config.site.name}' already exists.")
-            console.print("")
-            console.print("[bold]To force reinstall, set:[/bold]")
-            console.print("  [cyan]export REALTIMEX_FORCE_REINSTALL=true[/cyan]")
-            console.print("")
-            console.print("[bold]Or delete manually:[/bold]")
-            console.print(f"  [cyan]rm -rf {bench_path}[/cyan]")
+            console.print("\n".join([
+                f"\n[yellow]Existing installation found at {bench_path}[/yellow]",
+                f"  Site '{site.name}' already exists.",
+                "",
+                "[bold]To force reinstall, set:[/bold]",
+                "  [cyan]export REALTIMEX_FORCE_REINSTALL=true[/cyan]",
+                "",
+                "[bold]Or delete manually:[/bold]",
+                f"  [cyan]rm -rf {bench_path}[/cyan]",
+            ]))
             raise SystemExit(1)
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -186,7 +206,7 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
     console.print("\n[bold]Configuring database connection...[/bold]")
 
     update_common_site_config(config)
-    console.print(f"[green]✓[/green] Connected to {config.database.host}")
+    console.print(f"[green]✓[/green] Connected to {db.host}")
 
     # ─────────────────────────────────────────────────────────────────────────
     # Step 7: Start bench (Redis required for site creation)
@@ -196,10 +216,10 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
 
     bench_proc = run_bench_start_subprocess(config)
     try:
-        import time
-
         # Wait for bench (including Redis) to be ready
-        time.sleep(5)
+        if not wait_for_bench_ready(port=config.bench.port, timeout=120, process=bench_proc):
+            console.print("[red]✗ Development server did not start[/red]")
+            raise SystemExit(1)
         console.print("[green]✓[/green] Development server started")
 
         # ─────────────────────────────────────────────────────────────────────
@@ -210,19 +230,19 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
         if site_exists(config):
             healthy, reason = site_is_healthy(config)
             if healthy:
-                console.print(f"[green]✓[/green] Site '{config.site.name}' exists")
+                console.print(f"[green]✓[/green] Site '{site.name}' exists")
             else:
                 console.print(f"[yellow]⚠ Recreating unhealthy site ({reason})...[/yellow]")
                 if not create_site(config, force=True):
                     console.print("[red]✗ Failed to create site[/red]")
                     raise SystemExit(1)
-                console.print(f"[green]✓[/green] Site '{config.site.name}' recreated")
+                console.print(f"[green]✓[/green] Site '{site.name}' recreated")
         else:
-            console.print(f"[dim]Creating site '{config.site.name}' with schema '{config.database.schema}'...[/dim]")
+            console.print(f"[dim]Creating site '{site.name}' with schema '{db.schema}'...[/dim]")
             if not create_site(config):
                 console.print("[red]✗ Failed to create site[/red]")
                 raise SystemExit(1)
-            console.print(f"[green]✓[/green] Site '{config.site.name}' created with database schema")
+            console.print(f"[green]✓[/green] Site '{site.name}' created with database schema")
 
         # ─────────────────────────────────────────────────────────────────────
         # Step 9: Install applications
@@ -239,32 +259,34 @@ def run_setup(config: Optional[RealtimexConfig] = None) -> None:
     finally:
         # Stop the temporary bench process
         console.print("[dim]Stopping development server...[/dim]")
-        bench_proc.terminate()
-        try:
-            bench_proc.wait(timeout=10)
-        except Exception:
-            bench_proc.kill()
+        stop_bench_subprocess(bench_proc)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Step 10: Output team credentials
     # ─────────────────────────────────────────────────────────────────────────
     # Frappe creates a user named after the schema (e.g., mysite_schema)
     # with the password provided via REALTIMEX_DB_PASSWORD
-    site_db_user = config.database.schema  # Frappe's design: user = schema name
-
-    console.print("\n" + "=" * 60)
-    console.print("[bold green]✓ Setup complete![/bold green]")
-    console.print("\n[bold]Share these with your team:[/bold]\n")
-
-    env_block = f"""export REALTIMEX_MODE=user
-export REALTIMEX_SITE_NAME={config.site.name}
-export REALTIMEX_DB_HOST={config.database.host}
-export REALTIMEX_DB_PORT={config.database.port}
-export REALTIMEX_DB_NAME={config.database.name}
-export REALTIMEX_DB_SCHEMA={config.database.schema}
-export REALTIMEX_DB_USER={site_db_user}
-export REALTIMEX_DB_PASSWORD={config.database.password}"""
-
-    console.print(f"[cyan]{env_block}[/cyan]")
-    console.print(f"\n[dim]Run: realtimex-frappe run[/dim]")
-    console.print(f"[dim]URL: http://{config.site.name}:{config.bench.port}[/dim]")
+    site_db_user = db.schema  # Frappe's design: user = schema name
+
+    console.print("\n".join([
+        "\n" + "=" * 60,
+        "[bold green]✓ Setup complete![/bold green]",
+        "\n[bold]Share these with your team:[/bold]\n",
+    ]))
+
+    env_block = "\n".join(f"export {name}={value}" for name, value in (
+        (ENV_MODE, "user"),
+        (ENV_SITE_NAME, site.name),
+        (ENV_DB_HOST, db.host),
+        (ENV_DB_PORT, db.port),
+        (ENV_DB_NAME, db.name),
+        (ENV_DB_SCHEMA, db.schema),
+        (ENV_DB_USER, site_db_user),
+        (ENV_DB_PASSWORD, db.password),
+    ))
+
+    console.print("\n".join([
+        f"[cyan]{env_block}[/cyan]",
+        "\n[dim]Run: realtimex-frappe run[/dim]",
+        f"[dim]URL: http://{site.name}:{config.bench.port}[/dim]",
+    ]))
@@ -1,9 +1,12 @@
 """Environment variable configuration support."""
 
 import os
-from typing import Optional
+import sys
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
 
-from .schema import RealtimexConfig, AppConfig
+if TYPE_CHECKING:
+    from .schema import RealtimexConfig
 
 
 # Environment variable prefix
@@ -36,30 +39,144 @@ ENV_FORCE_REINSTALL = f"{ENV_PREFIX}FORCE_REINSTALL"
 
 def get_env_or_none(key: str) -> Optional[str]:
     """Get environment variable or None if not set or empty."""
-    value = os.environ.get(key, "").strip()
-    return value if value else None
+    value = os.environ.get(key)
+    if not value:
+        return None
+    return value.strip() or None
 
 
 def get_env_int(key: str, default: Optional[int] = None) -> Optional[int]:
     """Get environment variable as integer."""
-    value = get_env_or_none(key)
-    if value is None:
-        return default
+    value = _parse_int(get_env_or_none(key))
+    return default if value is None else value
+
+
+def get_env_bool(key: str, default: bool = False) -> bool:
+    """Get environment variable as boolean."""
+    return _parse_bool(get_env_or_none(key), default, key)
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    """Parse an integer setting, or None if unset or not a number."""
+    if not value:
+        return None
     try:
         return int(value)
     except ValueError:
-        return default
+        return None
 
 
-def get_env_bool(key: str, default: bool = False) -> bool:
-    """Get environment variable as boolean."""
-    value = get_env_or_none(key)
-    if value is None:
+def _parse_port(value: Optional[str]) -> Optional[int]:
+    """Parse a port setting; zero counts as unset and keeps the default."""
+    return _parse_int(value) or None
+
+
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
+_FALSY = frozenset({"false", "0", "no", "off", "n", "f"})
+
+
+def _parse_bool(value: Optional[str], default: bool = False, key: str = "value") -> bool:
+    """Parse a boolean setting, falling back to default if unset.
+
+    Raises:
+        ValueError: If the value is neither a truthy nor a falsy spelling.
+    """
+    if not value:
         return default
-    return value.lower() in ("true", "1", "yes", "on")
+    # Values are usually already lowercase; only fold on a miss
+    folded = value if value in _TRUTHY or value in _FALSY else value.casefold()
+    if folded in _TRUTHY:
+        return True
+    if folded in _FALSY:
+        return False
+    raise ValueError(f"Invalid {key}: '{value}'. Must be true/false, yes/no, on/off or 1/0")
+
+
+def _parse_mode(value: str) -> str:
+    """Parse the run mode, case-insensitively.
+
+    Raises:
+        ValueError: If the value is not 'admin' or 'user'.
+    """
+    mode = value.lower()
+    if mode not in ("admin", "user"):
+        raise ValueError(f"Invalid {ENV_MODE}: '{value}'. Must be 'admin' or 'user'")
+    return mode
+
+
+class EnvSpec(NamedTuple):
+    """Specification of one supported environment variable."""
+
+    name: str
+    # Path of the config field it sets, or None if handled specially
+    path: Optional[tuple[str, ...]]
+    # Parser for the stripped value; None leaves the default in place
+    parser: Callable[[str], Any]
+    # "Yes" (always), "Admin" (admin mode only) or "No"
+    required: str
+    default: str
+    description: str
+
+
+# Every supported variable, in the order shown by env-help
+ENV_VAR_SPECS: tuple[EnvSpec, ...] = (
+    EnvSpec(ENV_MODE, ("mode",), _parse_mode, "Yes", "-", "Operational mode: 'admin' (setup) or 'user' (run only)"),
+    EnvSpec(ENV_SITE_NAME, ("site", "name"), str, "Yes", "-", "Site name (e.g., mysite.localhost)"),
+    EnvSpec(ENV_SITE_PASSWORD, ("site", "site_password"), str, "Admin", "-", "Frappe Administrator password (required in admin mode)"),
+    EnvSpec(ENV_DB_NAME, ("database", "name"), str, "Yes", "-", "PostgreSQL database name"),
+    EnvSpec(ENV_DB_USER, ("database", "user"), str, "Yes", "-", "PostgreSQL username (site credentials)"),
+    EnvSpec(ENV_DB_PASSWORD, ("database", "password"), str, "Yes", "-", "PostgreSQL password (site credentials)"),
+    EnvSpec(ENV_ADMIN_DB_USER, ("database", "admin_user"), str, "Admin", "-", "Root DB username for CREATE DATABASE (admin mode)"),
+    EnvSpec(ENV_ADMIN_DB_PASSWORD, ("database", "admin_password"), str, "Admin", "-", "Root DB password for CREATE DATABASE (admin mode)"),
+    EnvSpec(ENV_DB_HOST, ("database", "host"), str, "No", "localhost", "PostgreSQL host"),
+    EnvSpec(ENV_DB_PORT, ("database", "port"), _parse_port, "No", "5432", "PostgreSQL port"),
+    EnvSpec(ENV_DB_SCHEMA, ("database", "schema"), str, "Admin", "-", "PostgreSQL schema (required for setup)"),
+    EnvSpec(ENV_DB_TYPE, ("database", "type"), str, "No", "postgres", "Database type"),
+    EnvSpec(ENV_REDIS_HOST, ("redis", "host"), str, "No", "127.0.0.1", "Redis host"),
+    EnvSpec(ENV_REDIS_CACHE_PORT, ("redis", "cache_port"), _parse_port, "No", "13001", "Redis cache port"),
+    EnvSpec(ENV_REDIS_QUEUE_PORT, ("redis", "queue_port"), _parse_port, "No", "11001", "Redis queue port"),
+    EnvSpec(ENV_BENCH_PATH, ("bench", "path"), str, "No", "~/.realtimex.ai/storage/local-apps/frappe-bench", "Bench path"),
+    EnvSpec(ENV_PORT, ("bench", "port"), _parse_port, "No", "8000", "Webserver port"),
+    EnvSpec(ENV_NODE_BIN_DIR, ("binaries", "node", "bin_dir"), str, "No", "-", "Path to bundled Node.js bin directory"),
+    EnvSpec(ENV_WKHTMLTOPDF_BIN_DIR, ("binaries", "wkhtmltopdf", "bin_dir"), str, "No", "-", "Path to bundled wkhtmltopdf bin directory"),
+    EnvSpec(ENV_FRAPPE_BRANCH, None, str, "No", "-", "Frappe branch, also used for all apps"),
+    EnvSpec(ENV_DEVELOPER_MODE, ("bench", "developer_mode"), partial(_parse_bool, key=ENV_DEVELOPER_MODE), "No", "true", "Enable developer mode"),
+    EnvSpec(ENV_FORCE_REINSTALL, ("force_reinstall",), partial(_parse_bool, key=ENV_FORCE_REINSTALL), "No", "false", "Force delete and reinstall (for recovery)"),
+)
+
+# Variables that map directly onto a config field: name -> (path, parser)
+_ENV_FIELDS: dict[str, tuple[tuple[str, ...], Callable[[str], Any]]] = {
+    spec.name: (spec.path, spec.parser) for spec in ENV_VAR_SPECS if spec.path
+}
+
+_REQUIRED_ALWAYS = tuple(spec.name for spec in ENV_VAR_SPECS if spec.required == "Yes")
+_REQUIRED_ADMIN = tuple(spec.name for spec in ENV_VAR_SPECS if spec.required == "Admin")
+
+
+def _env_snapshot() -> tuple[tuple[str, str], ...]:
+    """Return a hashable snapshot of all REALTIMEX_* environment variables.
+
+    Used as the cache key for the environment-derived helpers below, so a
+    change to any relevant variable transparently invalidates the cache.
+    """
+    return tuple(sorted(
+        (name, value) for name, value in os.environ.items()
+        if name.startswith(ENV_PREFIX)
+    ))
 
 
-def config_from_environment() -> RealtimexConfig:
+def _snapshot_values(snapshot: tuple[tuple[str, str], ...]) -> dict[str, str]:
+    """Map a snapshot to its non-blank, stripped values."""
+    return {name: stripped for name, value in snapshot if (stripped := value.strip())}
+
+
+def clear_env_cache() -> None:
+    """Discard cached results derived from environment variables."""
+    _config_from_snapshot.cache_clear()
+    _missing_from_snapshot.cache_clear()
+
+
+def config_from_environment() -> "RealtimexConfig":
     """Create a configuration from environment variables.
 
     Environment variables:
@@ -79,79 +196,51 @@ def config_from_environment() -> RealtimexConfig:
         REALTIMEX_FRAPPE_BRANCH: Frappe branch (default: version-15)
         REALTIMEX_DEVELOPER_MODE: Enable developer mode (default: true)
 
+    The config is built once per snapshot of REALTIMEX_* variables; each
+    call returns a deep copy that the caller may modify freely.
+
     Returns:
         RealtimexConfig populated from environment variables.
     """
-    from .loader import get_default_config
-
-    # Start with default config
-    config = get_default_config()
-    data = config.model_dump()
-
-    # Site settings
-    if site_name := get_env_or_none(ENV_SITE_NAME):
-        data["site"]["name"] = site_name
-    if site_password := get_env_or_none(ENV_SITE_PASSWORD):
-        data["site"]["site_password"] = site_password
-
-    # Database settings
-    if db_type := get_env_or_none(ENV_DB_TYPE):
-        data["database"]["type"] = db_type
-    if db_host := get_env_or_none(ENV_DB_HOST):
-        data["database"]["host"] = db_host
-    if db_port := get_env_int(ENV_DB_PORT):
-        data["database"]["port"] = db_port
-    if db_name := get_env_or_none(ENV_DB_NAME):
-        data["database"]["name"] = db_name
-    if db_user := get_env_or_none(ENV_DB_USER):
-        data["database"]["user"] = db_user
-    if db_password := get_env_or_none(ENV_DB_PASSWORD):
-        data["database"]["password"] = db_password
-    if db_schema := get_env_or_none(ENV_DB_SCHEMA):
-        data["database"]["schema"] = db_schema
-    if admin_db_user := get_env_or_none(ENV_ADMIN_DB_USER):
-        data["database"]["admin_user"] = admin_db_user
-    if admin_db_password := get_env_or_none(ENV_ADMIN_DB_PASSWORD):
-        data["database"]["admin_password"] = admin_db_password
-
-    # Redis settings
-    if redis_host := get_env_or_none(ENV_REDIS_HOST):
-        data["redis"]["host"] = redis_host
-    if redis_cache_port := get_env_int(ENV_REDIS_CACHE_PORT):
-        data["redis"]["cache_port"] = redis_cache_port
-    if redis_queue_port := get_env_int(ENV_REDIS_QUEUE_PORT):
-        data["redis"]["queue_port"] = redis_queue_port
-
-    # Bench settings
-    if bench_path := get_env_or_none(ENV_BENCH_PATH):
-        data["bench"]["path"] = bench_path
-    if bench_port := get_env_int(ENV_PORT):
-        data["bench"]["port"] = bench_port
-    data["bench"]["developer_mode"] = get_env_bool(ENV_DEVELOPER_MODE, default=True)
-
-    # Binary paths
-    if node_bin_dir := get_env_or_none(ENV_NODE_BIN_DIR):
-        data["binaries"]["node"]["bin_dir"] = node_bin_dir
-    if wkhtmltopdf_bin_dir := get_env_or_none(ENV_WKHTMLTOPDF_BIN_DIR):
-        data["binaries"]["wkhtmltopdf"]["bin_dir"] = wkhtmltopdf_bin_dir
+    return _config_from_snapshot(_env_snapshot()).model_copy(deep=True)
+
+
+@lru_cache(maxsize=1)
+def _config_from_snapshot(snapshot: tuple[tuple[str, str], ...]) -> "RealtimexConfig":
+    """Build the configuration for a given environment snapshot.
+
+    The returned instance is shared; only hand out copies of it.
+    """
+    from .loader import _default_config_data
+    from .schema import RealtimexConfig
+
+    # Values are screened to REALTIMEX_* by the snapshot; blanks count as unset
+    env = _snapshot_values(snapshot)
+
+    # Apply overrides to the raw bundled defaults and validate exactly once
+    data = _default_config_data()
+
+    # Direct field overrides: one dict lookup per REALTIMEX_* variable
+    for name, value in env.items():
+        target = _ENV_FIELDS.get(name)
+        if target is None:
+            continue
+        path, parse = target
+        parsed = parse(value)
+        if parsed is None:
+            continue
+        section = data
+        for key in path[:-1]:
+            section = section.setdefault(key, {})
+        section[path[-1]] = parsed
 
     # Frappe settings
-    if frappe_branch := get_env_or_none(ENV_FRAPPE_BRANCH):
-        data["frappe"]["branch"] = frappe_branch
+    if frappe_branch := env.get(ENV_FRAPPE_BRANCH):
+        data.setdefault("frappe", {})["branch"] = frappe_branch
         # Also update apps to use the same branch
-        for app in data["apps"]:
+        for app in data.get("apps", []):
             app["branch"] = frappe_branch
 
-    # Mode setting
-    if mode := get_env_or_none(ENV_MODE):
-        mode_lower = mode.lower()
-        if mode_lower not in ("admin", "user"):
-            raise ValueError(f"Invalid {ENV_MODE}: '{mode}'. Must be 'admin' or 'user'")
-        data["mode"] = mode_lower
-
-    # Force reinstall setting
-    data["force_reinstall"] = get_env_bool(ENV_FORCE_REINSTALL, default=False)
-
     return RealtimexConfig.model_validate(data)
 
 
@@ -165,33 +254,30 @@ def get_missing_required_env_vars() -> list[str]:
     Returns:
         List of missing environment variable names.
     """
-    # Mode is always required - no silent defaults
-    required = [ENV_MODE]
+    return list(_missing_from_snapshot(_env_snapshot()))
 
-    mode = (get_env_or_none(ENV_MODE) or "").lower()
 
-    # Base requirements for both modes
-    required.extend([
-        ENV_SITE_NAME,
-        ENV_DB_NAME,
-        ENV_DB_USER,
-        ENV_DB_PASSWORD,
-    ])
+@lru_cache(maxsize=1)
+def _missing_from_snapshot(snapshot: tuple[tuple[str, str], ...]) -> tuple[str, ...]:
+    """Compute missing required variables for a given environment snapshot."""
+    env = _snapshot_values(snapshot)
 
-    # Admin mode requires additional credentials for setup
-    if mode == "admin":
-        required.extend([
-            ENV_DB_SCHEMA,           # Schema name (required for setup)
-            ENV_SITE_PASSWORD,       # Frappe Administrator password
-            ENV_ADMIN_DB_USER,       # Root DB user for CREATE DATABASE
-            ENV_ADMIN_DB_PASSWORD,   # Root DB password
-        ])
+    # Admin mode additionally requires schema, site password and root DB
+    # credentials; mode itself is always required - no silent defaults
+    required = _REQUIRED_ALWAYS
+    if env.get(ENV_MODE, "").lower() == "admin":
+        required += _REQUIRED_ADMIN
 
-    return [var for var in required if not get_env_or_none(var)]
+    return tuple(var for var in required if var not in env)
 
 
-def print_env_var_help() -> None:
-    """Print help for environment variables."""
+@lru_cache(maxsize=1)
+def _render_env_var_help() -> str:
+    """Render the environment variable help table once.
+
+    Returns:
+        The rendered table, including any terminal styling.
+    """
     from rich.console import Console
     from rich.table import Table
 
@@ -203,27 +289,15 @@ def print_env_var_help() -> None:
     table.add_column("Default")
     table.add_column("Description")
 
-    env_vars = [
-        (ENV_MODE, "Yes", "-", "Operational mode: 'admin' (setup) or 'user' (run only)"),
-        (ENV_SITE_NAME, "Yes", "-", "Site name (e.g., mysite.localhost)"),
-        (ENV_SITE_PASSWORD, "Admin", "-", "Frappe Administrator password (required in admin mode)"),
-        (ENV_DB_NAME, "Yes", "-", "PostgreSQL database name"),
-        (ENV_DB_USER, "Yes", "-", "PostgreSQL username (site credentials)"),
-        (ENV_DB_PASSWORD, "Yes", "-", "PostgreSQL password (site credentials)"),
-        (ENV_ADMIN_DB_USER, "Admin", "-", "Root DB username for CREATE DATABASE (admin mode)"),
-        (ENV_ADMIN_DB_PASSWORD, "Admin", "-", "Root DB password for CREATE DATABASE (admin mode)"),
-        (ENV_DB_HOST, "No", "localhost", "PostgreSQL host"),
-        (ENV_DB_PORT, "No", "5432", "PostgreSQL port"),
-        (ENV_DB_SCHEMA, "Admin", "-", "PostgreSQL schema (required for setup)"),
-        (ENV_DB_TYPE, "No", "postgres", "Database type"),
-        (ENV_REDIS_HOST, "No", "127.0.0.1", "Redis host"),
-        (ENV_BENCH_PATH, "No", "~/.realtimex.ai/storage/local-apps/frappe-bench", "Bench path"),
-        (ENV_NODE_BIN_DIR, "No", "-", "Path to bundled Node.js bin directory"),
-        (ENV_DEVELOPER_MODE, "No", "true", "Enable developer mode"),
-        (ENV_FORCE_REINSTALL, "No", "false", "Force delete and reinstall (for recovery)"),
-    ]
-
-    for var, required, default, desc in env_vars:
-        table.add_row(var, required, default, desc)
-
-    console.print(table)
+    for spec in ENV_VAR_SPECS:
+        table.add_row(spec.name, spec.required, spec.default, spec.description)
+
+    with console.capture() as capture:
+        console.print(table)
+    return capture.get()
+
+
+def print_env_var_help() -> None:
+    """Print help for environment variables."""
+    sys.stdout.write(_render_env_var_help())
+    sys.stdout.flush()
@@ -1,59 +1,131 @@
 """Configuration file loading and writing utilities."""
 
 import json
+from functools import lru_cache
 from importlib import resources
+from importlib.resources.abc import Traversable
 from pathlib import Path
 from typing import Optional
 
 from .schema import RealtimexConfig
 
+# Parsed config files, keyed by path -> ((mtime_ns, size), config)
+_config_cache: dict[str, tuple[tuple[int, int], RealtimexConfig]] = {}
+
 
 def load_config(config_path: str | Path) -> RealtimexConfig:
-    """Load configuration from a JSON file."""
+    """Load configuration from a JSON file.
+
+    Parsed files are cached per path until their mtime or size changes;
+    each call returns a deep copy that the caller may modify freely.
+    Loading the bundled default.json returns get_default_config().
+    """
     path = Path(config_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {path}") from None
 
-    with open(path) as f:
-        data = json.load(f)
+    key = str(path.resolve())
 
-    return RealtimexConfig.model_validate(data)
+    # The bundled defaults are trusted and already validated once
+    if key == _bundled_config_path():
+        return get_default_config()
 
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(key)
+    if cached is None or cached[0] != stamp:
+        # Parse straight into the model, without an intermediate dict
+        cached = (stamp, RealtimexConfig.model_validate_json(path.read_bytes()))
+        _config_cache[key] = cached
 
-def get_default_config() -> RealtimexConfig:
-    """Get the default configuration from bundled default.json.
+    return cached[1].model_copy(deep=True)
 
-    Uses importlib.resources to reliably load the bundled config file
+
+def clear_config_cache() -> None:
+    """Discard all cached configuration files."""
+    _config_cache.clear()
+
+
+@lru_cache(maxsize=1)
+def _bundled_config_file() -> Traversable:
+    """Locate the bundled default.json, resolved once per process.
+
+    Uses importlib.resources to reliably find the bundled config file
     regardless of installation method (uvx, pip, editable install).
     """
     from .. import data as data_package
 
-    config_file = resources.files(data_package).joinpath("default.json")
-    config_text = config_file.read_text(encoding="utf-8")
-    config_data = json.loads(config_text)
-    return RealtimexConfig.model_validate(config_data)
+    return resources.files(data_package).joinpath("default.json")
 
 
-def write_default_config(output_path: str | Path) -> None:
-    """Write the default configuration to a JSON file."""
-    path = Path(output_path)
-    config = get_default_config()
+@lru_cache(maxsize=1)
+def _bundled_config_path() -> Optional[str]:
+    """Get the resolved filesystem path of the bundled default.json.
+
+    Returns:
+        The path, or None if the package isn't installed as plain files
+        (e.g. imported from a zip).
+    """
+    config_file = _bundled_config_file()
+    if not isinstance(config_file, Path):
+        return None
+    return str(config_file.resolve())
+
 
-    # Convert to dict and handle Path objects
-    data = json.loads(config.model_dump_json())
+@lru_cache(maxsize=1)
+def _default_config_text() -> str:
+    """Read the bundled default.json once per process."""
+    return _bundled_config_file().read_text(encoding="utf-8")
+
+
+def _default_config_data() -> dict:
+    """Parse the bundled default.json into a fresh, unvalidated dict.
+
+    Callers own the returned dict and may modify it.
+    """
+    return json.loads(_default_config_text())
 
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+
+@lru_cache(maxsize=1)
+def _default_config() -> RealtimexConfig:
+    """Parse and validate the bundled default.json once per process.
+
+    The returned instance is shared; only hand out copies of it.
+    """
+    return RealtimexConfig.model_validate_json(_default_config_text())
+
+
+def get_default_config() -> RealtimexConfig:
+    """Get the default configuration from bundled default.json.
+
+    The bundled file is validated once per process; each call returns a
+    deep copy that the caller may modify freely.
+    """
+    return _default_config().model_copy(deep=True)
+
+
+@lru_cache(maxsize=1)
+def _default_config_output() -> bytes:
+    """Serialize the validated defaults for write_default_config(), once.
+
+    The full model is written rather than the bundled file, so the output
+    lists every field (including ones default.json omits) under its
+    current name.
+    """
+    return _default_config().model_dump_json(indent=2).encode("utf-8")
+
+
+def write_default_config(output_path: str | Path) -> None:
+    """Write the default configuration to a JSON file."""
+    Path(output_path).write_bytes(_default_config_output())
 
 
 def write_config(config: RealtimexConfig, output_path: str | Path) -> None:
     """Write a configuration to a JSON file."""
     path = Path(output_path)
-    data = json.loads(config.model_dump_json())
-
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    path.write_text(config.model_dump_json(indent=2), encoding="utf-8")
 
 
 def merge_config_with_cli(
@@ -69,17 +141,23 @@ def merge_config_with_cli(
 ) -> RealtimexConfig:
     """Merge configuration file with CLI options.
 
-    CLI options take precedence over config file values.
+    CLI options take precedence over config file values. The result is
+    always a new config; the one passed in is never modified through it.
     """
     base_config = config or get_default_config()
 
-    return base_config.with_overrides(
-        site_name=site_name,
-        site_password=site_password,
-        db_host=db_host,
-        db_port=db_port,
-        db_name=db_name,
-        db_user=db_user,
-        db_password=db_password,
-        bench_path=bench_path,
-    )
+    overrides = {
+        "site_name": site_name,
+        "site_password": site_password,
+        "db_host": db_host,
+        "db_port": db_port,
+        "db_name": db_name,
+        "db_user": db_user,
+        "db_password": db_password,
+        "bench_path": bench_path,
+    }
+    if all(value is None for value in overrides.values()):
+        # get_default_config() already returned a private copy
+        return base_config if config is None else config.model_copy(deep=True)
+
+    return base_config.with_overrides(**overrides)
@@ -1,10 +1,11 @@
 """Pydantic models for configuration validation."""
 
+import re
 from enum import Enum
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
 
 from ..utils.paths import get_default_bench_path
 
@@ -29,6 +30,9 @@ class FrappeConfig(BaseModel):
 class AppConfig(BaseModel):
     """Configuration for a Frappe app to install."""
 
+    # Immutable so configs derived via with_overrides can share app entries
+    model_config = ConfigDict(frozen=True)
+
     name: str
     url: str
     branch: str = "version-15"
@@ -81,11 +85,25 @@ class RedisConfig(BaseModel):
         return f"redis://{self.host}:{self.queue_port}"
 
 
+def _check_port(v: int) -> int:
+    """Reject ports outside 1-65535."""
+    # v >> 16 is 0 exactly for 0 <= v <= 65535 (negatives shift to -1)
+    if v >> 16 or not v:
+        raise ValueError("Port must be between 1 and 65535")
+    return v
+
+
+# Valid PostgreSQL schema names, and names that can't be used for a site
+_SCHEMA_RE = re.compile(r'^[a-z][a-z0-9_]*$')
+_RESERVED_SCHEMAS = frozenset({'public', 'information_schema'})
+
+
 class DatabaseConfig(BaseModel):
     """Configuration for database connection."""
 
     type: Literal["postgres", "mariadb"] = "postgres"
-    host: str = "localhost"
+    host: Annotated[str, StringConstraints(strip_whitespace=True)] = "localhost"
+    """Database host (e.g., db.xxx.supabase.co); surrounding whitespace is stripped."""
     port: int = 5432
     name: Optional[str] = None
     user: Optional[str] = None
@@ -100,33 +118,24 @@ class DatabaseConfig(BaseModel):
     admin_password: Optional[str] = None
     """Root/admin password for database setup."""
 
-    @field_validator("host")
-    @classmethod
-    def validate_host(cls, v: str) -> str:
-        """Accept Supabase hosts like db.xxx.supabase.co."""
-        return v.strip()
-
     @field_validator("port")
     @classmethod
     def validate_port(cls, v: int) -> int:
         """Ensure port is valid."""
-        if not 1 <= v <= 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        return v
+        return _check_port(v)
 
     @field_validator("schema")
     @classmethod
     def validate_schema(cls, v: Optional[str]) -> Optional[str]:
         """Validate PostgreSQL schema name."""
-        import re
         if v is None:
             return None
         v = v.strip().lower()
         if not v:
             return None
-        if not re.match(r'^[a-z][a-z0-9_]*$', v):
+        if not _SCHEMA_RE.match(v):
             raise ValueError("Schema must be lowercase, start with letter, contain only [a-z0-9_]")
-        if v in ('public', 'information_schema') or v.startswith('pg_'):
+        if v in _RESERVED_SCHEMAS or v.startswith('pg_'):
             raise ValueError(f"Cannot use reserved schema name: {v}")
         if len(v) > 63:
             raise ValueError("Schema name too long (max 63 chars)")
@@ -163,9 +172,7 @@ class BenchConfig(BaseModel):
     @classmethod
     def validate_port(cls, v: int) -> int:
         """Ensure port is valid."""
-        if not 1 <= v <= 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        return v
+        return _check_port(v)
 
 
 class RealtimexConfig(BaseModel):
@@ -174,7 +181,7 @@ class RealtimexConfig(BaseModel):
     version: str = "1.0.0"
     mode: Optional[RunMode] = None
     frappe: FrappeConfig = Field(default_factory=FrappeConfig)
-    apps: list[AppConfig] = Field(default_factory=list)
+    apps: tuple[AppConfig, ...] = ()
     binaries: BinariesConfig = Field(default_factory=BinariesConfig)
     redis: RedisConfig = Field(default_factory=RedisConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
@@ -194,24 +201,31 @@ class RealtimexConfig(BaseModel):
         db_password: Optional[str] = None,
         bench_path: Optional[str] = None,
     ) -> "RealtimexConfig":
-        """Create a new config with CLI overrides applied."""
-        data = self.model_dump()
-
-        if site_name is not None:
-            data["site"]["name"] = site_name
-        if site_password is not None:
-            data["site"]["site_password"] = site_password
-        if db_host is not None:
-            data["database"]["host"] = db_host
-        if db_port is not None:
-            data["database"]["port"] = db_port
-        if db_name is not None:
-            data["database"]["name"] = db_name
-        if db_user is not None:
-            data["database"]["user"] = db_user
-        if db_password is not None:
-            data["database"]["password"] = db_password
-        if bench_path is not None:
-            data["bench"]["path"] = bench_path
-
-        return RealtimexConfig.model_validate(data)
+        """Create a new config with CLI overrides applied.
+
+        Only sections with overrides are revalidated; unchanged sections
+        are deep-copied, so the result can be modified without affecting
+        this config.
+        """
+        overrides = {
+            "site": {"name": site_name, "site_password": site_password},
+            "database": {
+                "host": db_host,
+                "port": db_port,
+                "name": db_name,
+                "user": db_user,
+                "password": db_password,
+            },
+            "bench": {"path": bench_path},
+        }
+
+        updates = {}
+        for section_name, fields in overrides.items():
+            changes = {key: value for key, value in fields.items() if value is not None}
+            if changes:
+                section = getattr(self, section_name)
+                updates[section_name] = type(section).model_validate(
+                    {**section.model_dump(), **changes}
+                )
+
+        return self.model_copy(update=updates, deep=True)
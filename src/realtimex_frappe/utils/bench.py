@@ -1,16 +1,72 @@
 """Bench command wrapper utilities."""
 
+import errno
+import hashlib
 import json
+import os
+import selectors
+import shlex
+import shutil
+import signal
+import socket
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from rich.console import Console
+from ..config.schema import AppConfig, RealtimexConfig
 
-from ..config.schema import RealtimexConfig
-from .environment import build_environment
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=8)
+def _bench_dir(bench_path: str) -> Path:
+    """Get the bench directory as a Path, built once per path string.
+
+    Args:
+        bench_path: The configured bench path.
+
+    Returns:
+        The bench path as a Path.
+    """
+    return Path(bench_path)
+
+
+@lru_cache(maxsize=8)
+def _site_dir(bench_path: str, site_name: str) -> Path:
+    """Get sites/<site name> under a bench, built once per pair.
+
+    Args:
+        bench_path: The configured bench path.
+        site_name: The site name.
+
+    Returns:
+        Path to the site directory.
+    """
+    return _bench_dir(bench_path) / "sites" / site_name
+
+
+def _site_path(config: RealtimexConfig) -> Path:
+    """Get the directory of the configured site inside the bench.
+
+    Args:
+        config: The realtimex configuration (site.name must be set).
+
+    Returns:
+        Path to sites/<site name> under the bench.
+    """
+    return _site_dir(config.bench.path, config.site.name)
 
 
 def run_bench_command(
@@ -30,10 +86,14 @@ def run_bench_command(
     Returns:
         The completed process result.
     """
+    from .environment import build_environment
+
+    console = _console()
+
     env = build_environment(config)
-    cmd = ["bench"] + args
+    cmd = ["bench", *args]
 
-    console.print(f"[dim]$ {' '.join(cmd)}[/dim]")
+    console.print(f"[dim]$ {shlex.join(cmd)}[/dim]")
 
     return subprocess.run(
         cmd,
@@ -53,6 +113,10 @@ def init_bench(config: RealtimexConfig) -> bool:
     Returns:
         True if initialization succeeded, False otherwise.
     """
+    from .environment import clear_binary_cache
+
+    console = _console()
+
     args = [
         "init",
         config.bench.path,
@@ -60,13 +124,14 @@ def init_bench(config: RealtimexConfig) -> bool:
         config.frappe.branch,
         "--frappe-path",
         config.frappe.repo,
+        *(("--dev",) if config.bench.developer_mode else ()),
     ]
 
-    if config.bench.developer_mode:
-        args.append("--dev")
-
     console.print("[blue]Initializing bench...[/blue]")
     result = run_bench_command(args, config)
+
+    # bench init installs binaries (e.g. env/bin); forget lookups made before it
+    clear_binary_cache()
     return result.returncode == 0
 
 
@@ -83,14 +148,17 @@ def update_common_site_config(config: RealtimexConfig) -> None:
     Args:
         config: The realtimex configuration.
     """
-    bench_path = Path(config.bench.path)
+    console = _console()
+
+    bench_path = _bench_dir(config.bench.path)
     config_path = bench_path / "sites" / "common_site_config.json"
 
     # Load existing config or start fresh
     site_config: dict = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            site_config = json.load(f)
+    try:
+        site_config = json.loads(config_path.read_bytes())
+    except FileNotFoundError:
+        pass
 
     # Set Redis URLs (separate ports for cache and queue)
     cache_url = config.redis.cache_url
@@ -122,8 +190,11 @@ def update_common_site_config(config: RealtimexConfig) -> None:
             site_config["db_schema"] = config.database.schema
 
     # Write config
-    with open(config_path, "w") as f:
-        json.dump(site_config, f, indent=2)
+    # Write a sibling temp file and rename it over the original, so a crash
+    # mid-write can never leave a truncated common_site_config.json
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(site_config, indent=2), encoding="utf-8")
+    os.replace(tmp_path, config_path)
 
     console.print(f"[green]✓[/green] Updated common_site_config.json")
     console.print(f"[dim]  Redis cache: {cache_url}[/dim]")
@@ -137,6 +208,55 @@ def update_common_site_config(config: RealtimexConfig) -> None:
     regenerate_bench_config(config)
 
 
+# File in the bench directory recording the inputs of the last regeneration
+BENCH_CONFIG_STAMP_FILE = ".realtimex-bench-config.sha256"
+
+# Files written by regenerate_bench_config(), relative to the bench
+_GENERATED_CONFIG_FILES = (
+    "Procfile",
+    os.path.join("config", "redis_cache.conf"),
+    os.path.join("config", "redis_queue.conf"),
+)
+
+
+def _bench_config_fingerprint(config: RealtimexConfig) -> str:
+    """Hash everything the generated Procfile and Redis configs depend on.
+
+    That is common_site_config.json, the node and redis-server binaries
+    bench renders into them (path and mtime, so an upgrade counts), whether
+    Redis is external, and CI, which toggles the watch process in the
+    Procfile. Binaries are looked up on the PATH bench commands run with,
+    so bundled ones are the ones fingerprinted.
+
+    Args:
+        config: The realtimex configuration.
+
+    Returns:
+        Hex digest of the inputs.
+    """
+    from .environment import build_environment
+
+    search_path = build_environment(config).get("PATH")
+
+    digest = hashlib.sha256()
+    try:
+        digest.update(Path(config.bench.path, "sites", "common_site_config.json").read_bytes())
+    except OSError:
+        pass
+
+    for name in ("node", "nodejs", "redis-server"):
+        path = shutil.which(name, path=search_path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns if path else None
+        except OSError:
+            mtime_ns = None
+        digest.update(f"\0{name}={path}:{mtime_ns}".encode())
+
+    digest.update(f"\0use_external={config.redis.use_external}".encode())
+    digest.update(f"\0CI={os.environ.get('CI')}".encode())
+    return digest.hexdigest()
+
+
 def regenerate_bench_config(config: RealtimexConfig) -> None:
     """Regenerate Bench config files after updating common_site_config.json.
 
@@ -144,36 +264,52 @@ def regenerate_bench_config(config: RealtimexConfig) -> None:
     - Procfile has correct webserver_port and includes Redis
     - Redis .conf files have correct ports (if not using external Redis)
 
-    Uses Bench's built-in functions for best practice compliance.
+    Uses Bench's built-in functions for best practice compliance. Skipped
+    when the generated files exist and their inputs are unchanged since
+    the last regeneration.
 
     Args:
         config: The realtimex configuration.
     """
-    from bench.config.procfile import setup_procfile
+    console = _console()
 
     bench_path = config.bench.path
+    stamp_file = _bench_dir(bench_path) / BENCH_CONFIG_STAMP_FILE
+    fingerprint = _bench_config_fingerprint(config)
 
-    # Regenerate Redis configs if not using external Redis
-    # When use_external=True, we use the external Redis URL from config
-    # but still include Redis in Procfile for local development
-    if not config.redis.use_external:
-        from bench.config.redis import generate_config as generate_redis_config
-        console.print("[dim]Regenerating Redis configs...[/dim]")
-        generate_redis_config(bench_path)
-    else:
-        # For external Redis, still regenerate configs to match the URL
-        from bench.config.redis import generate_config as generate_redis_config
+    try:
+        up_to_date = stamp_file.read_text() == fingerprint
+    except OSError:
+        up_to_date = False
+    if up_to_date and all(
+        os.path.exists(os.path.join(bench_path, name)) for name in _GENERATED_CONFIG_FILES
+    ):
+        console.print("[dim]Bench config files are up to date[/dim]")
+        return
+
+    from bench.config.procfile import setup_procfile
+    from bench.config.redis import generate_config as generate_redis_config
+
+    # Redis configs are regenerated in both modes: with use_external=True
+    # they still have to match the external Redis URL from config, and
+    # Redis stays in the Procfile for local development
+    if config.redis.use_external:
         console.print("[dim]Regenerating Redis configs for external Redis...[/dim]")
-        generate_redis_config(bench_path)
+    else:
+        console.print("[dim]Regenerating Redis configs...[/dim]")
+    generate_redis_config(bench_path)
 
     # Always include Redis in Procfile - bench manages Redis startup
     # skip_redis=False means Redis will be started by bench
     console.print("[dim]Regenerating Procfile...[/dim]")
     setup_procfile(bench_path, yes=True, skip_redis=False)
 
-    console.print(f"[green]✓[/green] Regenerated Bench config files")
-
+    try:
+        stamp_file.write_text(fingerprint)
+    except OSError:
+        pass
 
+    console.print(f"[green]✓[/green] Regenerated Bench config files")
 
 
 def create_site(config: RealtimexConfig, force: bool = False) -> bool:
@@ -189,6 +325,8 @@ def create_site(config: RealtimexConfig, force: bool = False) -> bool:
     Returns:
         True if site creation succeeded, False otherwise.
     """
+    console = _console()
+
     if not config.site.name:
         console.print("[red]✗ Site name is required[/red]")
         return False
@@ -201,37 +339,31 @@ def create_site(config: RealtimexConfig, force: bool = False) -> bool:
         console.print("[red]✗ Admin DB credentials required (REALTIMEX_ADMIN_DB_USER/PASSWORD)[/red]")
         return False
 
-    bench_path = Path(config.bench.path)
+    bench_path = _bench_dir(config.bench.path)
 
     args = [
         "new-site",
         config.site.name,
         "--admin-password",
         config.site.site_password,
+        # Force recreate if recovering from partial state
+        *(("--force",) if force else ()),
     ]
 
-    # Force recreate if recovering from partial state
-    if force:
-        args.append("--force")
-
-    # Database type
-    if config.database.type:
-        args.extend(["--db-type", config.database.type])
-
-    # Database connection settings
-    if config.database.host:
-        args.extend(["--db-host", config.database.host])
-    if config.database.port:
-        args.extend(["--db-port", str(config.database.port)])
-    if config.database.name:
-        args.extend(["--db-name", config.database.name])
-    if config.database.password:
-        args.extend(["--db-password", config.database.password])
-
-    # Pass admin credentials as root credentials for database setup
-    # Frappe will use these to CREATE DATABASE and CREATE USER
-    args.extend(["--db-root-username", config.database.admin_user])
-    args.extend(["--db-root-password", config.database.admin_password])
+    db = config.database
+    options = (
+        # Database type and connection settings (omitted when unset)
+        ("--db-type", db.type),
+        ("--db-host", db.host),
+        ("--db-port", db.port),
+        ("--db-name", db.name),
+        ("--db-password", db.password),
+        # Pass admin credentials as root credentials for database setup
+        # Frappe will use these to CREATE DATABASE and CREATE USER
+        ("--db-root-username", db.admin_user),
+        ("--db-root-password", db.admin_password),
+    )
+    args += [item for flag, value in options if value for item in (flag, str(value))]
 
     console.print(f"[blue]Creating site {config.site.name}...[/blue]")
     result = run_bench_command(args, config, cwd=bench_path)
@@ -259,12 +391,13 @@ def create_site_for_user_mode(config: RealtimexConfig) -> bool:
     Returns:
         True if successful, False otherwise.
     """
+    console = _console()
+
     if not config.site.name:
         console.print("[red]✗ Site name is required[/red]")
         return False
 
-    bench_path = Path(config.bench.path)
-    site_path = bench_path / "sites" / config.site.name
+    site_path = _site_path(config)
 
     # Create site directory structure
     # Must match Frappe's make_site_dirs() in frappe/installer.py:
@@ -322,7 +455,7 @@ def get_app(
     Returns:
         True if successful, False otherwise.
     """
-    bench_path = Path(config.bench.path)
+    bench_path = _bench_dir(config.bench.path)
 
     args = [
         "get-app",
@@ -348,54 +481,115 @@ def install_app(
     Returns:
         True if successful, False otherwise.
     """
+    return install_apps(config, [app_name])
+
+
+def install_apps(
+    config: RealtimexConfig,
+    app_names: list[str],
+) -> bool:
+    """Install several apps on the configured site with one bench call.
+
+    'bench install-app' accepts multiple apps and installs them in order,
+    so this pays bench's startup cost once rather than once per app.
+
+    Args:
+        config: The realtimex configuration.
+        app_names: Names of the apps to install, in install order.
+
+    Returns:
+        True if successful, False otherwise.
+    """
+    console = _console()
+
     if not config.site.name:
         console.print("[red]✗ Site name is required[/red]")
         return False
 
-    bench_path = Path(config.bench.path)
+    bench_path = _bench_dir(config.bench.path)
 
     args = [
         "--site",
         config.site.name,
         "install-app",
-        app_name,
+        *app_names,
     ]
 
     result = run_bench_command(args, config, cwd=bench_path)
     return result.returncode == 0
 
 
-def install_all_apps(config: RealtimexConfig) -> bool:
-    """Get and install all apps from configuration.
+def _apps_to_install(
+    config: RealtimexConfig,
+    announce_skipped: bool = True,
+) -> Iterator[tuple[AppConfig, Path]]:
+    """Yield the configured apps marked for install, with their app directory.
 
     Args:
         config: The realtimex configuration.
+        announce_skipped: Print a note for each app with install=false.
 
-    Returns:
-        True if all apps were installed successfully, False otherwise.
+    Yields:
+        Tuples of (app, path to apps/<app name> under the bench).
     """
+    console = _console()
+
+    apps_dir = _bench_dir(config.bench.path) / "apps"
     for app in config.apps:
         if not app.install:
-            console.print(f"[dim]Skipping {app.name} (install=false)[/dim]")
+            if announce_skipped:
+                console.print(f"[dim]Skipping {app.name} (install=false)[/dim]")
             continue
+        yield app, apps_dir / app.name
 
-        # Get the app
-        console.print(f"[blue]Getting {app.name}...[/blue]")
-        if not get_app(config, app.url, app.branch):
-            console.print(f"[red]✗ Failed to get {app.name}[/red]")
-            return False
 
-        # Install on site
-        console.print(f"[blue]Installing {app.name} on {config.site.name}...[/blue]")
-        if not install_app(config, app.name):
-            console.print(f"[red]✗ Failed to install {app.name}[/red]")
-            return False
+def _fetch_app(config: RealtimexConfig, app: AppConfig, app_path: Path) -> bool:
+    """Clone an app into the bench unless it is already there.
+
+    Args:
+        config: The realtimex configuration.
+        app: The app to fetch.
+        app_path: The app's directory under apps/.
 
-        console.print(f"[green]✓[/green] Installed {app.name}")
+    Returns:
+        True if the app is present afterwards, False if cloning failed.
+    """
+    console = _console()
 
+    if app_path.exists():
+        console.print(f"[green]✓[/green] App {app.name} already exists")
+        return True
+
+    console.print(f"[blue]Getting {app.name}...[/blue]")
+    if not get_app(config, app.url, app.branch):
+        console.print(f"[red]✗ Failed to get {app.name}[/red]")
+        return False
+
+    console.print(f"[green]✓[/green] Got {app.name}")
     return True
 
 
+def install_all_apps(config: RealtimexConfig) -> bool:
+    """Get and install all apps from configuration.
+
+    Apps that are already cloned are not fetched again, and all apps are
+    then installed with a single bench call.
+
+    Args:
+        config: The realtimex configuration.
+
+    Returns:
+        True if all apps were installed successfully, False otherwise.
+    """
+    app_names = []
+    for app, app_path in _apps_to_install(config):
+        if not _fetch_app(config, app, app_path):
+            return False
+        app_names.append(app.name)
+
+    return _install_on_site(config, app_names)
+
+
 def get_all_apps(config: RealtimexConfig) -> bool:
     """Get (clone) all apps from configuration without installing.
 
@@ -408,29 +602,16 @@ def get_all_apps(config: RealtimexConfig) -> bool:
     Returns:
         True if all apps were cloned successfully, False otherwise.
     """
-    for app in config.apps:
-        if not app.install:
-            console.print(f"[dim]Skipping {app.name} (install=false)[/dim]")
-            continue
-
-        # Check if app already exists
-        bench_path = Path(config.bench.path)
-        app_path = bench_path / "apps" / app.name
-        if app_path.exists():
-            console.print(f"[green]✓[/green] App {app.name} already exists")
-            continue
-
-        console.print(f"[blue]Getting {app.name}...[/blue]")
-        if not get_app(config, app.url, app.branch):
-            console.print(f"[red]✗ Failed to get {app.name}[/red]")
-            return False
-
-        console.print(f"[green]✓[/green] Got {app.name}")
-
-    return True
+    # Apps are fetched one at a time on purpose: each 'bench get-app' also
+    # pip-installs into the shared env and rewrites sites/apps.txt, so
+    # concurrent runs can drop entries from apps.txt.
+    return all(_fetch_app(config, app, app_path) for app, app_path in _apps_to_install(config))
 
 
-def install_apps_on_site(config: RealtimexConfig) -> bool:
+def install_apps_on_site(
+    config: RealtimexConfig,
+    app_names: Optional[list[str]] = None,
+) -> bool:
     """Install all apps on the site (requires bench to be running).
 
     This step installs apps that have been cloned but not yet installed.
@@ -438,24 +619,79 @@ def install_apps_on_site(config: RealtimexConfig) -> bool:
 
     Args:
         config: The realtimex configuration.
+        app_names: Apps to install (e.g. from site_missing_apps()).
+            Defaults to every app marked for install.
 
     Returns:
         True if all apps were installed successfully, False otherwise.
     """
-    for app in config.apps:
-        if not app.install:
-            continue
+    if app_names is None:
+        app_names = [app.name for app, _ in _apps_to_install(config, announce_skipped=False)]
+    return _install_on_site(config, app_names)
 
-        console.print(f"[blue]Installing {app.name} on {config.site.name}...[/blue]")
-        if not install_app(config, app.name):
-            console.print(f"[red]✗ Failed to install {app.name}[/red]")
-            return False
 
-        console.print(f"[green]✓[/green] Installed {app.name}")
+def site_missing_apps(config: RealtimexConfig) -> list[str]:
+    """Get the apps marked for install that are not yet installed on the site.
+
+    The site's installed apps come from 'bench list-apps', which reads the
+    site database but does not need a running bench. If the list can't be
+    read, every app is reported missing so the caller installs them.
+
+    Args:
+        config: The realtimex configuration.
+
+    Returns:
+        Names of the missing apps, in configuration order.
+    """
+    wanted = [app.name for app, _ in _apps_to_install(config, announce_skipped=False)]
+    if not wanted or not config.site.name:
+        return wanted
+
+    result = run_bench_command(
+        ["--site", config.site.name, "list-apps", "--format", "json"],
+        config,
+        cwd=_bench_dir(config.bench.path),
+        capture_output=True,
+    )
+    installed: set[str] = set()
+    if result.returncode == 0:
+        try:
+            installed = set(json.loads(result.stdout)[config.site.name])
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    return [name for name in wanted if name not in installed]
+
+
+def _install_on_site(config: RealtimexConfig, app_names: list[str]) -> bool:
+    """Install the given apps on the site in one bench call, with progress output.
+
+    Args:
+        config: The realtimex configuration.
+        app_names: Names of the apps to install.
+
+    Returns:
+        True if all apps were installed successfully (or there were none).
+    """
+    if not app_names:
+        return True
+
+    console = _console()
+    names = ", ".join(app_names)
+
+    console.print(f"[blue]Installing {names} on {config.site.name}...[/blue]")
+    if not install_apps(config, app_names):
+        console.print(f"[red]✗ Failed to install {names}[/red]")
+        return False
 
+    console.print(f"[green]✓[/green] Installed {names}")
     return True
 
 
+# Directories whose presence marks an initialized bench
+_BENCH_DIRS = frozenset({"sites", "apps"})
+
+
 def bench_exists(config: RealtimexConfig) -> bool:
     """Check if the bench directory already exists.
 
@@ -465,8 +701,13 @@ def bench_exists(config: RealtimexConfig) -> bool:
     Returns:
         True if the bench directory exists and appears valid.
     """
-    bench_path = Path(config.bench.path)
-    return (bench_path / "sites").exists() and (bench_path / "apps").exists()
+    # One directory read answers both checks; entry types come from readdir
+    try:
+        with os.scandir(config.bench.path) as entries:
+            found = {entry.name for entry in entries if entry.name in _BENCH_DIRS and entry.is_dir()}
+    except OSError:
+        return False
+    return found == _BENCH_DIRS
 
 
 def site_exists(config: RealtimexConfig) -> bool:
@@ -481,10 +722,11 @@ def site_exists(config: RealtimexConfig) -> bool:
     if not config.site.name:
         return False
 
-    bench_path = Path(config.bench.path)
-    site_path = bench_path / "sites" / config.site.name
+    return os.path.exists(_site_path(config))
+
 
-    return site_path.exists()
+# site_config.json keys that must have a non-empty value for a healthy site
+_REQUIRED_SITE_KEYS = frozenset({"db_name"})
 
 
 def site_is_healthy(config: RealtimexConfig) -> tuple[bool, str]:
@@ -493,7 +735,7 @@ def site_is_healthy(config: RealtimexConfig) -> tuple[bool, str]:
     Performs multi-level validation:
     1. Site directory exists
     2. site_config.json exists and is valid JSON
-    3. site_config.json contains required db_name field
+    3. site_config.json sets every required field (currently db_name)
 
     Args:
         config: The realtimex configuration.
@@ -505,30 +747,88 @@ def site_is_healthy(config: RealtimexConfig) -> tuple[bool, str]:
     if not config.site.name:
         return False, "not_found"
 
-    bench_path = Path(config.bench.path)
-    site_path = bench_path / "sites" / config.site.name
+    return _check_site(str(_site_path(config)))
 
-    # Level 1: Site directory exists
-    if not site_path.exists():
-        return False, "not_found"
 
-    # Level 2: site_config.json exists
-    config_file = site_path / "site_config.json"
-    if not config_file.exists():
+def _check_site(site_path: str) -> tuple[bool, str]:
+    """Check one site directory; see site_is_healthy() for the verdicts.
+
+    Args:
+        site_path: Path to the site directory.
+
+    Returns:
+        Tuple of (is_healthy, reason).
+    """
+    config_path = os.path.join(site_path, "site_config.json")
+
+    # Level 1 & 2: site directory and site_config.json exist
+    # Opening the config answers both when it is present
+    try:
+        with open(config_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        if not os.path.exists(site_path):
+            return False, "not_found"
         return False, "missing_config"
+    except OSError:
+        return False, "invalid_config"
 
-    # Level 3: site_config.json is valid and has db_name
+    # Level 3: site_config.json is a valid JSON object with the required keys set
     try:
-        with open(config_file) as f:
-            site_cfg = json.load(f)
-        if not site_cfg.get("db_name"):
-            return False, "incomplete_config"
-    except (json.JSONDecodeError, OSError):
+        site_cfg = json.loads(raw)
+    except ValueError:
         return False, "invalid_config"
 
+    if not isinstance(site_cfg, dict):
+        return False, "invalid_config"
+    if _REQUIRED_SITE_KEYS.difference(name for name, value in site_cfg.items() if value):
+        return False, "incomplete_config"
     return True, "healthy"
 
 
+# Entries of sites/ that are never sites
+_NON_SITE_DIRS = frozenset({"assets"})
+
+# Upper bound on concurrent site checks in sites_health
+_MAX_HEALTH_WORKERS = 8
+
+
+def sites_health(config: RealtimexConfig) -> dict[str, tuple[bool, str]]:
+    """Check every site in the bench with one directory scan.
+
+    Each directory under sites/ (other than assets) is checked as in
+    site_is_healthy(). The checks are I/O-bound and independent, so
+    several are run concurrently.
+
+    Args:
+        config: The realtimex configuration.
+
+    Returns:
+        Mapping of site name to (is_healthy, reason); empty if the bench
+        has no sites directory.
+    """
+    sites_dir = os.path.join(config.bench.path, "sites")
+    try:
+        with os.scandir(sites_dir) as entries:
+            site_paths = {
+                entry.name: entry.path
+                for entry in entries
+                if entry.is_dir()
+                and entry.name not in _NON_SITE_DIRS
+                and not entry.name.startswith(".")
+            }
+    except OSError:
+        return {}
+
+    if len(site_paths) < 2:
+        return {name: _check_site(path) for name, path in site_paths.items()}
+
+    workers = min(len(site_paths), _MAX_HEALTH_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_check_site, site_paths.values())
+        return dict(zip(site_paths, results))
+
+
 def start_bench(config: RealtimexConfig) -> None:
     """Start the bench server (blocking).
 
@@ -538,21 +838,31 @@ def start_bench(config: RealtimexConfig) -> None:
     Args:
         config: The realtimex configuration.
     """
-    import os
-    import sys
+    from .environment import build_environment, get_binary_path
+
+    console = _console()
 
-    bench_path = Path(config.bench.path).resolve()
+    bench_path = _bench_dir(config.bench.path).resolve()
     env = build_environment(config)
 
+    # Resolve against the same PATH the bench will run with, so a missing
+    # bench is reported here instead of as a bare ENOENT from exec
+    bench_bin = get_binary_path("bench", config)
+    if bench_bin is None:
+        console.print("[red]✗ bench executable not found on PATH[/red]")
+        raise SystemExit(1)
+    # PATH may hold relative entries; pin the binary before changing directory
+    bench_bin = os.path.abspath(bench_bin)
+
     console.print(f"\n[bold green]Starting bench at {bench_path}...[/bold green]")
     console.print(f"[dim]Site will be available at: http://{config.site.name}:{config.bench.port}[/dim]\n")
 
     # Change to bench directory and exec bench start
     os.chdir(bench_path)
 
-    # Use os.execvpe to replace the current process with bench start
+    # Use os.execve to replace the current process with bench start
     # This ensures the process keeps running and handles signals properly
-    os.execvpe("bench", ["bench", "start"], env)
+    os.execve(bench_bin, ["bench", "start"], env)
 
 
 def run_bench_start_subprocess(config: RealtimexConfig) -> subprocess.Popen:
@@ -564,15 +874,186 @@ def run_bench_start_subprocess(config: RealtimexConfig) -> subprocess.Popen:
     Returns:
         The subprocess.Popen object for the running bench.
     """
-    bench_path = Path(config.bench.path).resolve()
+    from .environment import build_environment
+
+    console = _console()
+
+    bench_path = _bench_dir(config.bench.path).resolve()
     env = build_environment(config)
 
     console.print(f"\n[bold green]Starting bench at {bench_path}...[/bold green]")
     console.print(f"[dim]Site will be available at: http://{config.site.name}:{config.bench.port}[/dim]\n")
 
+    # Own session/process group so the whole tree (redis, web, workers)
+    # can be signalled at once by stop_bench_subprocess()
     return subprocess.Popen(
         ["bench", "start"],
         cwd=bench_path,
         env=env,
+        start_new_session=True,
     )
 
+
+def _start_connect(addr: tuple[str, int]) -> Optional[socket.socket]:
+    """Open a non-blocking socket and begin connecting it to addr.
+
+    Args:
+        addr: The (host, port) address to connect to.
+
+    Returns:
+        The socket with its connect in progress (or already complete), or
+        None if the connect failed immediately.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    err = sock.connect_ex(addr)
+    if err in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+        return sock
+    sock.close()
+    return None
+
+
+def _open_exit_fd(process: Optional[subprocess.Popen]) -> Optional[int]:
+    """Open a file descriptor that becomes readable when process exits.
+
+    Args:
+        process: The process to watch, or None.
+
+    Returns:
+        A pidfd for the process, or None if unavailable on this platform.
+    """
+    if process is None or not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(process.pid)
+    except OSError:
+        return None
+
+
+def wait_for_bench_ready(
+    port: int = 8000,
+    timeout: int = 60,
+    process: Optional[subprocess.Popen] = None,
+) -> bool:
+    """Wait for bench to be ready (web server available on specified port).
+
+    Probes the port with exponential backoff (50ms doubling up to 1s), so
+    a server that comes up quickly is detected almost immediately. A connect
+    that is still in progress is kept across intervals; a new socket is only
+    opened once the previous attempt has definitively failed.
+
+    Args:
+        port: The port to check for webserver availability.
+        timeout: Maximum seconds to wait.
+        process: The bench process being waited on; if it exits, waiting
+            stops immediately.
+
+    Returns:
+        True if bench is ready, False on timeout or if the process exited.
+    """
+    console = _console()
+
+    addr = ("127.0.0.1", port)
+    deadline = time.monotonic() + timeout
+    next_notice = time.monotonic() + 5
+    delay = 0.05
+    sock: Optional[socket.socket] = None
+    exit_fd = _open_exit_fd(process)
+
+    with selectors.DefaultSelector() as selector:
+        # Waits below also wake as soon as the bench process exits
+        if exit_fd is not None:
+            selector.register(exit_fd, selectors.EVENT_READ)
+        try:
+            while True:
+                attempt_start = time.monotonic()
+                if sock is None:
+                    sock = _start_connect(addr)
+                    if sock is not None:
+                        selector.register(sock, selectors.EVENT_WRITE)
+
+                ready = {key.fileobj for key, _ in selector.select(delay)}
+                if sock is not None and sock in ready:
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return True
+                    # Connect was refused; a socket cannot reconnect, so drop it
+                    selector.unregister(sock)
+                    sock.close()
+                    sock = None
+
+                if process is not None and process.poll() is not None:
+                    console.print(f"[red]✗ Bench exited with code {process.returncode}[/red]")
+                    return False
+
+                now = time.monotonic()
+                if now >= deadline:
+                    return False
+
+                # Wait out the rest of this interval if the probe failed fast
+                remaining = delay - (now - attempt_start)
+                if remaining > 0:
+                    if exit_fd is not None:
+                        selector.select(min(remaining, deadline - now))
+                    else:
+                        time.sleep(min(remaining, deadline - now))
+
+                if now >= next_notice:
+                    console.print("[dim]Waiting for bench to be ready...[/dim]")
+                    next_notice = now + 5
+
+                delay = min(delay * 2, 1.0)
+        finally:
+            if sock is not None:
+                sock.close()
+            if exit_fd is not None:
+                os.close(exit_fd)
+
+
+def stop_bench_subprocess(process: subprocess.Popen, timeout: float = 5) -> None:
+    """Stop a bench started by run_bench_start_subprocess() and its children.
+
+    Sends SIGTERM to the bench's process group, then SIGKILL if the group
+    hasn't exited within the timeout. The group is signalled even if bench
+    itself has already exited, so surviving children (redis, node,
+    workers) are cleaned up too.
+
+    Args:
+        process: The Popen object returned by run_bench_start_subprocess().
+        timeout: Seconds to wait after SIGTERM before escalating.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        # Whole group already gone
+        process.wait()
+        return
+
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        pass
+
+    # bench may exit before its children; give the rest of the group the
+    # same deadline before escalating
+    while _group_alive(process.pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    if _group_alive(process.pid):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    process.wait()
+
+
+def _group_alive(pgid: int) -> bool:
+    """Check whether any process in the given process group still exists."""
+    try:
+        os.killpg(pgid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The group exists but a member belongs to another user
+        return True
+    return True
@@ -1,7 +1,12 @@
 """Environment configuration utilities for bundled binaries."""
 
+import hashlib
+import json
 import os
 import shutil
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -19,6 +24,58 @@ class BinaryValidationResult(NamedTuple):
         """Check if all required binaries are available."""
         return len(self.missing) == 0
 
+    @classmethod
+    def from_paths(
+        cls,
+        paths: dict[str, str | None],
+        binaries: list[str],
+    ) -> "BinaryValidationResult":
+        """Partition binaries into available/missing from resolved paths.
+
+        Args:
+            paths: Mapping of binary name to resolved path (or None).
+            binaries: Binary names to include in the result.
+
+        Returns:
+            A BinaryValidationResult for the given binaries.
+        """
+        available = [name for name in binaries if paths.get(name)]
+        missing = [name for name in binaries if not paths.get(name)]
+        return cls(available=available, missing=missing)
+
+
+def _bundled_bin_dirs(config: RealtimexConfig) -> list[str]:
+    """Collect the existing bundled binary directories from the config.
+
+    Args:
+        config: The realtimex configuration.
+
+    Returns:
+        Resolved bin directories, in PATH priority order.
+    """
+    # bin_dir fields are validated as Path already, so they key the cache as-is
+    bin_dirs = (config.binaries.node.bin_dir, config.binaries.wkhtmltopdf.bin_dir)
+    # Missing directories are checked again on every call, so one created
+    # later in the run is picked up; only existing ones are memoized
+    return [
+        _resolve_bin_dir(bin_dir)
+        for bin_dir in bin_dirs
+        if bin_dir and bin_dir.exists()
+    ]
+
+
+@lru_cache(maxsize=16)
+def _resolve_bin_dir(bin_dir: Path) -> str:
+    """Resolve an existing bin directory, memoized per process.
+
+    Args:
+        bin_dir: The configured directory, which must exist.
+
+    Returns:
+        The resolved directory.
+    """
+    return str(bin_dir.resolve())
+
 
 def build_environment(config: RealtimexConfig) -> dict[str, str]:
     """Build environment variables with custom binary paths prepended to PATH.
@@ -32,29 +89,103 @@ def build_environment(config: RealtimexConfig) -> dict[str, str]:
     Returns:
         A copy of the current environment with custom paths prepended.
     """
-    env = os.environ.copy()
+    search_path = _search_path(config)
+    if search_path is None:
+        return dict(os.environ)
+    return {**os.environ, "PATH": search_path}
 
-    # Collect custom bin directories
-    custom_paths: list[str] = []
 
-    # Add Node.js bin directory (contains node, npm, yarn if installed globally)
-    if config.binaries.node.bin_dir:
-        node_bin = Path(config.binaries.node.bin_dir)
-        if node_bin.exists():
-            custom_paths.append(str(node_bin.resolve()))
+def _search_path(config: RealtimexConfig) -> str | None:
+    """Get the current PATH with bundled binary directories prepended.
 
-    # Add wkhtmltopdf bin directory
-    if config.binaries.wkhtmltopdf.bin_dir:
-        wk_bin = Path(config.binaries.wkhtmltopdf.bin_dir)
-        if wk_bin.exists():
-            custom_paths.append(str(wk_bin.resolve()))
+    Args:
+        config: The realtimex configuration.
+
+    Returns:
+        The PATH string, or None if PATH is unset and nothing is bundled.
+    """
+    current_path = os.environ.get("PATH")
+    custom_paths = _bundled_bin_dirs(config)
 
-    # Prepend custom paths to PATH
     if custom_paths:
-        current_path = env.get("PATH", "")
-        env["PATH"] = os.pathsep.join(custom_paths + [current_path])
+        return os.pathsep.join(custom_paths + [current_path or ""])
+    return current_path
+
+
+def _which(binary: str, search_path: str | None) -> str | None:
+    """Resolve a binary on the given search path.
+
+    Relative PATH entries (an empty entry means the current directory) are
+    made absolute first, so memoized lookups never depend on the working
+    directory and the returned path is always absolute.
+
+    Args:
+        binary: Name of the binary to find.
+        search_path: PATH-style string to search, or None for the default path.
+
+    Returns:
+        The absolute path to the binary, or None if not found.
+    """
+    if os.path.dirname(binary):
+        found = shutil.which(binary, path=search_path)
+        return os.path.abspath(found) if found else None
+
+    if search_path is None:
+        search_path = os.environ.get("PATH", os.defpath)
+
+    absolute_path = os.pathsep.join(
+        os.path.abspath(directory or os.curdir)
+        for directory in search_path.split(os.pathsep)
+    )
+    return _which_on_path(binary, absolute_path)
+
+
+@lru_cache(maxsize=64)
+def _which_on_path(binary: str, search_path: str) -> str | None:
+    """Resolve a bare binary name on an absolute search path, memoized per process.
+
+    Args:
+        binary: Name of the binary to find.
+        search_path: PATH-style string of absolute directories.
+
+    Returns:
+        The full path to the binary, or None if not found.
+    """
+    for directory in dict.fromkeys(search_path.split(os.pathsep)):
+        if binary not in _dir_entries(directory):
+            continue
+        candidate = os.path.join(directory, binary)
+        if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=128)
+def _dir_entries(directory: str) -> frozenset[str]:
+    """List the names in a PATH directory, memoized per process.
+
+    Every lookup shares one listing per directory, so resolving N binaries
+    reads each PATH entry once instead of stat-ing it N times. Only called
+    with absolute directories; clear_binary_cache() drops the listings
+    once a step installs new binaries.
+
+    Args:
+        directory: Absolute directory to list.
+
+    Returns:
+        The entry names, or an empty set if the directory can't be read.
+    """
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
 
-    return env
+def clear_binary_cache() -> None:
+    """Discard memoized binary lookups (e.g., after installing a binary)."""
+    _which_on_path.cache_clear()
+    _dir_entries.cache_clear()
+    _resolve_bin_dir.cache_clear()
 
 
 def validate_binaries(
@@ -63,8 +194,8 @@ def validate_binaries(
 ) -> BinaryValidationResult:
     """Validate that required binaries are available.
 
-    This temporarily updates PATH to include bundled binary directories,
-    then checks for the presence of each required binary.
+    Each binary is looked up on PATH with the bundled binary directories
+    prepended. Lookups are memoized per search path.
 
     Args:
         config: The realtimex configuration.
@@ -77,25 +208,51 @@ def validate_binaries(
     if required_binaries is None:
         required_binaries = ["node", "npm", "yarn", "wkhtmltopdf"]
 
-    env = build_environment(config)
-    original_path = os.environ.get("PATH", "")
+    paths = resolve_binaries(config, required_binaries)
+    return BinaryValidationResult.from_paths(paths, required_binaries)
+
+
+def resolve_binaries(
+    config: RealtimexConfig,
+    binaries: list[str],
+) -> dict[str, str | None]:
+    """Resolve several binaries against the custom environment in one pass.
+
+    The search path is computed once and shared by every lookup. Lookups
+    run serially: they share the memoized directory listings, so each
+    directory is read once and the rest are cache hits.
+
+    Args:
+        config: The realtimex configuration.
+        binaries: Names of the binaries to find.
+
+    Returns:
+        Mapping of binary name to its full path, or None if not found.
+    """
+    search_path = _search_path(config)
+    return {binary: _which(binary, search_path) for binary in binaries}
 
-    try:
-        # Temporarily update PATH for shutil.which to use
-        os.environ["PATH"] = env["PATH"]
 
-        available: list[str] = []
-        missing: list[str] = []
+def validate_binaries_bulk(
+    config: RealtimexConfig,
+    required: list[str],
+    optional: list[str],
+) -> tuple[BinaryValidationResult, BinaryValidationResult]:
+    """Validate required and optional binaries with a single resolution pass.
 
-        for binary in required_binaries:
-            if shutil.which(binary):
-                available.append(binary)
-            else:
-                missing.append(binary)
+    Args:
+        config: The realtimex configuration.
+        required: Binaries that must be available.
+        optional: Binaries that are nice to have.
 
-        return BinaryValidationResult(available=available, missing=missing)
-    finally:
-        os.environ["PATH"] = original_path
+    Returns:
+        Tuple of (required_result, optional_result).
+    """
+    paths = resolve_binaries(config, required + optional)
+    return (
+        BinaryValidationResult.from_paths(paths, required),
+        BinaryValidationResult.from_paths(paths, optional),
+    )
 
 
 def get_binary_path(
@@ -111,14 +268,7 @@ def get_binary_path(
     Returns:
         The full path to the binary, or None if not found.
     """
-    env = build_environment(config)
-    original_path = os.environ.get("PATH", "")
-
-    try:
-        os.environ["PATH"] = env["PATH"]
-        return shutil.which(binary_name)
-    finally:
-        os.environ["PATH"] = original_path
+    return _which(binary_name, _search_path(config))
 
 
 # System prerequisites that must be installed on the host system
@@ -217,7 +367,7 @@ def validate_system_prerequisites() -> PrerequisiteValidationResult:
     missing_optional: list[str] = []
 
     for binary, info in SYSTEM_PREREQUISITES.items():
-        if shutil.which(binary):
+        if _which(binary, os.environ.get("PATH")):
             available.append(binary)
         elif info["required"]:
             missing_required.append(binary)
@@ -231,6 +381,7 @@ def validate_system_prerequisites() -> PrerequisiteValidationResult:
     )
 
 
+@lru_cache(maxsize=None)
 def get_prerequisite_install_hint(binary: str) -> str | None:
     """Get installation hint for a missing prerequisite.
 
@@ -240,8 +391,6 @@ def get_prerequisite_install_hint(binary: str) -> str | None:
     Returns:
         Installation command hint, or None if not found.
     """
-    import sys
-
     if binary not in SYSTEM_PREREQUISITES:
         return None
 
@@ -253,23 +402,159 @@ def get_prerequisite_install_hint(binary: str) -> str | None:
         return hints.get("linux")
 
 
+# File in the bench directory recording the last successful validation
+VALIDATION_STAMP_FILE = ".realtimex-validated.json"
+
+
+def _hash_inputs(config: RealtimexConfig, search_path: str | None) -> str:
+    """Hash the validation inputs for comparison against a validation stamp.
+
+    The config is what the REALTIMEX_* variables (or a config file) resolve
+    to, so any settings change invalidates the stamp, as does a new PATH.
+    """
+    digest = hashlib.sha256(config.model_dump_json().encode())
+    digest.update(b"\0")
+    digest.update((search_path or "").encode())
+    return digest.hexdigest()
+
+
+def _paths_from_stamp(
+    stamp_file: Path,
+    inputs_hash: str,
+    search_path: str | None,
+    binaries: list[str],
+) -> dict[str, str | None] | None:
+    """Reuse resolved binary paths from a still-valid validation stamp.
+
+    The stamp is valid when it was written for the same config and search
+    path and every recorded binary still has the same mtime. Binaries not
+    recorded in the stamp (e.g. missing optional ones) are resolved afresh.
+
+    Args:
+        stamp_file: Path to the validation stamp file.
+        inputs_hash: Hash of the current config and search path.
+        search_path: The current effective search path.
+        binaries: Names of all binaries being validated.
+
+    Returns:
+        Mapping of binary name to path, or None if the stamp is stale.
+    """
+    try:
+        stamp = json.loads(stamp_file.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(stamp, dict):
+        return None
+    if stamp.get("inputs_hash") != inputs_hash:
+        return None
+
+    recorded = stamp.get("binaries", {})
+    if not isinstance(recorded, dict):
+        return None
+    paths: dict[str, str | None] = {}
+    for name in binaries:
+        if name not in recorded:
+            paths[name] = _which(name, search_path)
+            continue
+        try:
+            path, mtime_ns = recorded[name]
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return None
+        except (OSError, TypeError, ValueError):
+            return None
+        paths[name] = path
+
+    return paths
+
+
+def _write_validation_stamp(
+    stamp_file: Path,
+    inputs_hash: str,
+    paths: dict[str, str | None],
+) -> None:
+    """Record resolved binaries so the next run can skip the PATH scan.
+
+    Does nothing if the stamp's directory (the bench) does not exist yet.
+    """
+    if not stamp_file.parent.is_dir():
+        return
+
+    binaries = {}
+    for name, path in paths.items():
+        if path:
+            try:
+                binaries[name] = [path, os.stat(path).st_mtime_ns]
+            except OSError:
+                continue
+
+    stamp = {
+        "inputs_hash": inputs_hash,
+        "binaries": binaries,
+        "validated_at": time.time(),
+    }
+    try:
+        stamp_file.write_text(json.dumps(stamp, indent=2))
+    except OSError:
+        pass
+
+
 def validate_all_prerequisites(
     config: RealtimexConfig,
+    stamp_file: Path | None = None,
 ) -> tuple[PrerequisiteValidationResult, BinaryValidationResult]:
     """Validate both system prerequisites and bundled binaries.
 
+    All names are resolved in a single pass against the same PATH that
+    bench commands run with (bundled bin directories prepended), and the
+    findings are then partitioned into the two results.
+
     Args:
         config: The realtimex configuration.
+        stamp_file: Optional validation stamp. When it matches the current
+            config, search path and binary mtimes, the PATH scan is skipped;
+            after a successful fresh validation it is (re)written. It is
+            discarded first when config.force_reinstall is set.
 
     Returns:
         Tuple of (system_result, binaries_result).
     """
-    system_result = validate_system_prerequisites()
-
     required_binaries = [
         name for name, info in BUNDLED_BINARIES.items() if info["required"]
     ]
-    binaries_result = validate_binaries(config, required_binaries)
+    names = [*SYSTEM_PREREQUISITES, *required_binaries]
+    search_path = _search_path(config)
+    inputs_hash = _hash_inputs(config, search_path)
+
+    paths = None
+    if stamp_file is not None:
+        if config.force_reinstall:
+            stamp_file.unlink(missing_ok=True)
+        else:
+            paths = _paths_from_stamp(stamp_file, inputs_hash, search_path, names)
+    from_stamp = paths is not None
+    if paths is None:
+        paths = resolve_binaries(config, names)
+
+    system_result = PrerequisiteValidationResult(
+        available=[name for name in SYSTEM_PREREQUISITES if paths[name]],
+        missing_required=[
+            name for name, info in SYSTEM_PREREQUISITES.items()
+            if info["required"] and not paths[name]
+        ],
+        missing_optional=[
+            name for name, info in SYSTEM_PREREQUISITES.items()
+            if not info["required"] and not paths[name]
+        ],
+    )
+    binaries_result = BinaryValidationResult.from_paths(paths, required_binaries)
 
-    return system_result, binaries_result
+    if (
+        stamp_file is not None
+        and not from_stamp
+        and system_result.is_valid
+        and binaries_result.is_valid
+    ):
+        _write_validation_stamp(stamp_file, inputs_hash, paths)
 
+    return system_result, binaries_result
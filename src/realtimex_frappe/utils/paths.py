@@ -1,20 +1,25 @@
 """RealTimeX path utilities for persistent storage."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_realtimex_user_dir() -> str:
     """Returns the path to the .realtimex.ai user directory.
 
     This is the base directory for all RealTimeX persistent storage.
 
+    The home directory is resolved once per process.
+
     Returns:
         Path to the user directory (e.g., ~/.realtimex.ai)
     """
     return os.path.join(os.path.expanduser("~"), ".realtimex.ai")
 
 
+@lru_cache(maxsize=1)
 def get_default_bench_path() -> str:
     """Returns the default path for Frappe bench installation.
 
@@ -46,7 +51,6 @@ def ensure_bench_directory() -> Path:
     bench_path = Path(get_default_bench_path())
     storage_dir = bench_path.parent
 
-    if not storage_dir.exists():
-        storage_dir.mkdir(parents=True, exist_ok=True)
+    storage_dir.mkdir(parents=True, exist_ok=True)
 
     return storage_dir
@@ -0,0 +1,14 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def bench_root(tmp_path_factory):
+    """Bench directory shared by a test module.
+
+    Tests that write into it use a site name unique to the test.
+    """
+    bench_path = tmp_path_factory.mktemp("bench")
+    (bench_path / "sites").mkdir()
+    return bench_path
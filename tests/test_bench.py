@@ -1,127 +1,352 @@
 """Tests for bench utilities including site health checks."""
 
 import json
-import tempfile
-from pathlib import Path
+import os
+import socket
+import subprocess
+import time
 
 import pytest
 
-from realtimex_frappe.config.schema import RealtimexConfig
-from realtimex_frappe.utils.bench import site_is_healthy
+from realtimex_frappe.config.schema import AppConfig, RealtimexConfig
+from realtimex_frappe.utils import bench, environment
+from realtimex_frappe.utils.bench import (
+    create_site,
+    init_bench,
+    regenerate_bench_config,
+    site_is_healthy,
+    site_missing_apps,
+    sites_health,
+    stop_bench_subprocess,
+    update_common_site_config,
+    wait_for_bench_ready,
+)
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    """Default configuration shared by tests that only derive overrides from it."""
+    return RealtimexConfig()
 
 
 class TestSiteIsHealthy:
     """Tests for site_is_healthy() function."""
 
-    def test_healthy_site(self):
-        """Test detection of a properly configured site."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            bench_path = Path(tmpdir)
-            site_name = "test.localhost"
-            site_path = bench_path / "sites" / site_name
+    @pytest.mark.parametrize(
+        "site_dir, site_config, expected",
+        [
+            (True, json.dumps({"db_name": "test_db", "db_password": "secret", "db_type": "postgres"}),
+             (True, "healthy")),
+            (False, None, (False, "not_found")),
+            (True, None, (False, "missing_config")),
+            (True, "{ this is not valid json }", (False, "invalid_config")),
+            (True, json.dumps({"db_type": "postgres"}), (False, "incomplete_config")),
+        ],
+        ids=["healthy", "not_found", "missing_config", "invalid_config", "incomplete_config"],
+    )
+    def test_site_health(self, request, bench_root, base_config, site_dir, site_config, expected):
+        """Test each health verdict for the site directory and its site_config.json."""
+        site_name = f"{request.node.callspec.id}.localhost"
+        site_path = bench_root / "sites" / site_name
+        if site_dir:
             site_path.mkdir(parents=True)
+        if site_config is not None:
+            (site_path / "site_config.json").write_text(site_config)
 
-            # Create valid site_config.json
-            config_file = site_path / "site_config.json"
-            config_file.write_text(json.dumps({
-                "db_name": "test_db",
-                "db_password": "secret",
-                "db_type": "postgres"
-            }))
-
-            config = RealtimexConfig()
-            config = config.with_overrides(
-                site_name=site_name,
-                bench_path=str(bench_path)
-            )
-
-            healthy, reason = site_is_healthy(config)
-            assert healthy is True
-            assert reason == "healthy"
-
-    def test_site_not_found(self):
-        """Test detection when site directory doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = RealtimexConfig()
-            config = config.with_overrides(
-                site_name="nonexistent.localhost",
-                bench_path=tmpdir
-            )
-
-            healthy, reason = site_is_healthy(config)
-            assert healthy is False
-            assert reason == "not_found"
-
-    def test_missing_site_config(self):
-        """Test detection when site_config.json is missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            bench_path = Path(tmpdir)
-            site_name = "partial.localhost"
-            site_path = bench_path / "sites" / site_name
-            site_path.mkdir(parents=True)
+        config = base_config.with_overrides(
+            site_name=site_name,
+            bench_path=str(bench_root)
+        )
 
-            # No site_config.json created
+        assert site_is_healthy(config) == expected
 
-            config = RealtimexConfig()
-            config = config.with_overrides(
-                site_name=site_name,
-                bench_path=str(bench_path)
-            )
+    def test_no_site_name(self, base_config):
+        """Test when site name is not configured."""
+        healthy, reason = site_is_healthy(base_config)
+        assert healthy is False
+        assert reason == "not_found"
 
-            healthy, reason = site_is_healthy(config)
-            assert healthy is False
-            assert reason == "missing_config"
+    def test_health_reread_after_config_change(self, bench_root, base_config):
+        """Test that health is re-read after site_config.json changes."""
+        site_name = "repaired.localhost"
+        site_path = bench_root / "sites" / site_name
+        site_path.mkdir(parents=True)
 
-    def test_invalid_json_config(self):
-        """Test detection when site_config.json is corrupted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            bench_path = Path(tmpdir)
-            site_name = "corrupt.localhost"
-            site_path = bench_path / "sites" / site_name
-            site_path.mkdir(parents=True)
+        config_file = site_path / "site_config.json"
+        config_file.write_text(json.dumps({"db_type": "postgres"}))
 
-            # Create invalid JSON
-            config_file = site_path / "site_config.json"
-            config_file.write_text("{ this is not valid json }")
-
-            config = RealtimexConfig()
-            config = config.with_overrides(
-                site_name=site_name,
-                bench_path=str(bench_path)
-            )
-
-            healthy, reason = site_is_healthy(config)
-            assert healthy is False
-            assert reason == "invalid_config"
-
-    def test_incomplete_config_missing_db_name(self):
-        """Test detection when db_name is missing from config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            bench_path = Path(tmpdir)
-            site_name = "incomplete.localhost"
-            site_path = bench_path / "sites" / site_name
-            site_path.mkdir(parents=True)
+        config = base_config.with_overrides(
+            site_name=site_name,
+            bench_path=str(bench_root)
+        )
 
-            # Create config without db_name
-            config_file = site_path / "site_config.json"
-            config_file.write_text(json.dumps({
-                "db_type": "postgres"
-            }))
+        assert site_is_healthy(config) == (False, "incomplete_config")
 
-            config = RealtimexConfig()
-            config = config.with_overrides(
-                site_name=site_name,
-                bench_path=str(bench_path)
-            )
+        # Simulate a repair that rewrites the config
+        config_file.write_text(json.dumps({
+            "db_name": "repaired_db",
+            "db_type": "postgres"
+        }))
 
-            healthy, reason = site_is_healthy(config)
-            assert healthy is False
-            assert reason == "incomplete_config"
+        assert site_is_healthy(config) == (True, "healthy")
 
-    def test_no_site_name(self):
-        """Test when site name is not configured."""
-        config = RealtimexConfig()
 
-        healthy, reason = site_is_healthy(config)
-        assert healthy is False
-        assert reason == "not_found"
+class TestSitesHealth:
+    """Tests for sites_health() function."""
+
+    def test_checks_every_site(self, tmp_path, base_config):
+        """Test that all sites are reported and non-site entries are skipped."""
+        sites_dir = tmp_path / "sites"
+        for name in ("good.localhost", "partial.localhost", "assets"):
+            (sites_dir / name).mkdir(parents=True)
+        (sites_dir / "good.localhost" / "site_config.json").write_text(
+            json.dumps({"db_name": "good_db"})
+        )
+        (sites_dir / "common_site_config.json").write_text("{}")
+
+        config = base_config.with_overrides(bench_path=str(tmp_path))
+
+        assert sites_health(config) == {
+            "good.localhost": (True, "healthy"),
+            "partial.localhost": (False, "missing_config"),
+        }
+
+    def test_missing_sites_directory(self, tmp_path, base_config):
+        """Test that a bench without sites/ reports no sites."""
+        config = base_config.with_overrides(bench_path=str(tmp_path))
+
+        assert sites_health(config) == {}
+
+
+class TestInitBench:
+    """Tests for init_bench() function."""
+
+    def test_binary_lookups_forgotten(self, tmp_path, monkeypatch, base_config):
+        """Test that lookups made before bench init don't hide binaries it installs."""
+        monkeypatch.setattr(
+            bench,
+            "run_bench_command",
+            lambda args, config: subprocess.CompletedProcess(args, 0),
+        )
+        environment._dir_entries(str(tmp_path))
+
+        assert init_bench(base_config)
+        assert environment._dir_entries.cache_info().currsize == 0
+
+
+class TestSiteMissingApps:
+    """Tests for site_missing_apps() function."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Config with two apps marked for install and one that is not."""
+        return RealtimexConfig(apps=[
+            AppConfig(name="erpnext", url="https://example.com/erpnext.git"),
+            AppConfig(name="hrms", url="https://example.com/hrms.git"),
+            AppConfig(name="crm", url="https://example.com/crm.git", install=False),
+        ]).with_overrides(site_name="test.localhost", bench_path=str(tmp_path))
+
+    @pytest.mark.parametrize(
+        ("returncode", "stdout", "expected"),
+        [
+            (0, '{"test.localhost": ["frappe", "erpnext"]}', ["hrms"]),
+            (0, '{"test.localhost": ["frappe", "erpnext", "hrms"]}', []),
+            (0, "not json", ["erpnext", "hrms"]),
+            (1, "", ["erpnext", "hrms"]),
+        ],
+    )
+    def test_missing_apps(self, config, monkeypatch, returncode, stdout, expected):
+        """Test that installed apps are subtracted, falling back to all apps."""
+        monkeypatch.setattr(
+            bench,
+            "run_bench_command",
+            lambda args, config, cwd=None, capture_output=False: subprocess.CompletedProcess(
+                args, returncode, stdout=stdout
+            ),
+        )
+
+        assert site_missing_apps(config) == expected
+
+
+class TestCreateSite:
+    """Tests for create_site() function."""
+
+    def test_new_site_args(self, monkeypatch):
+        """Test that unset database options are left out of the command."""
+        calls = []
+        monkeypatch.setattr(
+            bench,
+            "run_bench_command",
+            lambda args, config, cwd=None: calls.append(args) or subprocess.CompletedProcess(args, 0),
+        )
+        config = RealtimexConfig().with_overrides(
+            site_name="test.localhost", site_password="admin", db_name="test_db"
+        )
+        config.database.admin_user = "postgres"
+        config.database.admin_password = "root"
+
+        assert create_site(config, force=True)
+        assert calls == [[
+            "new-site", "test.localhost",
+            "--admin-password", "admin",
+            "--force",
+            "--db-type", "postgres",
+            "--db-host", "localhost",
+            "--db-port", "5432",
+            "--db-name", "test_db",
+            "--db-root-username", "postgres",
+            "--db-root-password", "root",
+        ]]
+
+
+class TestUpdateCommonSiteConfig:
+    """Tests for update_common_site_config() function."""
+
+    def test_merges_into_existing_config(self, tmp_path, monkeypatch, base_config):
+        """Test that existing keys survive and no temp file is left behind."""
+        monkeypatch.setattr(bench, "regenerate_bench_config", lambda config: None)
+        sites_dir = tmp_path / "sites"
+        sites_dir.mkdir()
+        config_path = sites_dir / "common_site_config.json"
+        config_path.write_text(json.dumps({"background_workers": 2}))
+
+        config = base_config.with_overrides(bench_path=str(tmp_path))
+        update_common_site_config(config)
+
+        site_config = json.loads(config_path.read_text())
+        assert site_config["background_workers"] == 2
+        assert site_config["webserver_port"] == config.bench.port
+        assert [p.name for p in sites_dir.iterdir()] == ["common_site_config.json"]
+
+
+class TestRegenerateBenchConfig:
+    """Tests for regenerate_bench_config() function."""
+
+    def test_skipped_when_inputs_unchanged(self, tmp_path, monkeypatch, base_config):
+        """Test that a matching stamp skips regeneration."""
+        calls = []
+        monkeypatch.setattr(
+            "bench.config.redis.generate_config", lambda path: calls.append("redis")
+        )
+        monkeypatch.setattr(
+            "bench.config.procfile.setup_procfile",
+            lambda path, **kwargs: calls.append("procfile"),
+        )
+        (tmp_path / "sites").mkdir()
+        (tmp_path / "sites" / "common_site_config.json").write_text("{}")
+        (tmp_path / "config").mkdir()
+        for name in ("Procfile", "config/redis_cache.conf", "config/redis_queue.conf"):
+            (tmp_path / name).write_text("")
+
+        config = base_config.with_overrides(bench_path=str(tmp_path))
+        regenerate_bench_config(config)
+        regenerate_bench_config(config)
+        assert calls == ["redis", "procfile"]
+
+        # Changing common_site_config.json invalidates the stamp
+        (tmp_path / "sites" / "common_site_config.json").write_text('{"webserver_port": 8001}')
+        regenerate_bench_config(config)
+        assert calls == ["redis", "procfile"] * 2
+
+        # So does switching to or from external Redis
+        config.redis.use_external = not config.redis.use_external
+        regenerate_bench_config(config)
+        assert calls == ["redis", "procfile"] * 3
+
+    def test_bundled_binary_change_invalidates(self, tmp_path, monkeypatch, base_config):
+        """Test that the fingerprint tracks binaries in the bundled bin_dir."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        node = bin_dir / "node"
+        node.write_text("#!/bin/sh\n")
+        node.chmod(0o755)
+        config = base_config.with_overrides(bench_path=str(tmp_path))
+        config.binaries.node.bin_dir = bin_dir
+
+        before = bench._bench_config_fingerprint(config)
+        st = node.stat()
+        os.utime(node, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert bench._bench_config_fingerprint(config) != before
+
+
+class TestStopBenchSubprocess:
+    """Tests for stop_bench_subprocess() function."""
+
+    def test_stops_whole_process_group(self):
+        """Test that children of the bench process are stopped too."""
+        process = subprocess.Popen(
+            ["sh", "-c", "sleep 30 & wait"],
+            start_new_session=True,
+        )
+
+        stop_bench_subprocess(process, timeout=5)
+
+        assert process.poll() is not None
+
+        # Orphaned children are reaped by init asynchronously
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                os.killpg(process.pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("process group still alive")
+
+    def test_stops_children_after_bench_exited(self):
+        """Test that children outliving the bench process are still stopped."""
+        process = subprocess.Popen(
+            ["sh", "-c", "sleep 30 & exit 0"],
+            start_new_session=True,
+        )
+        process.wait()
+
+        stop_bench_subprocess(process, timeout=5)
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                os.killpg(process.pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("orphaned children still alive")
+
+    def test_already_exited(self):
+        """Test that an exited process without children is handled cleanly."""
+        process = subprocess.Popen(["true"], start_new_session=True)
+        process.wait()
+
+        stop_bench_subprocess(process)
+
+        assert process.returncode == 0
+
+
+class TestWaitForBenchReady:
+    """Tests for wait_for_bench_ready() function."""
+
+    def test_ready_when_port_listening(self):
+        """Test that a listening port is detected without waiting."""
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            port = server.getsockname()[1]
+
+            start = time.monotonic()
+            assert wait_for_bench_ready(port=port, timeout=5)
+            assert time.monotonic() - start < 1
+
+    def test_gives_up_when_process_exits(self):
+        """Test that a crashed bench process ends the wait early."""
+        with socket.socket() as server:
+            # Bound but not listening, so connects are refused
+            server.bind(("127.0.0.1", 0))
+            port = server.getsockname()[1]
+            process = subprocess.Popen(["false"])
+
+            start = time.monotonic()
+            assert not wait_for_bench_ready(port=port, timeout=30, process=process)
+            assert time.monotonic() - start < 5
@@ -0,0 +1,56 @@
+"""Tests for the command-line interface."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from realtimex_frappe.cli import main
+from realtimex_frappe.commands import new_site
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Record the arguments create_new_site is called with."""
+    calls = []
+    monkeypatch.setattr(new_site, "create_new_site", lambda **kwargs: calls.append(kwargs) or True)
+    return calls
+
+
+class TestNewSite:
+    """Tests for the new-site command."""
+
+    def test_config_values_not_prompted(self, tmp_path, captured):
+        """Test that values supplied by --config run without prompting."""
+        config_file = tmp_path / "realtimex.json"
+        config_file.write_text(json.dumps({
+            "site": {"name": "test.localhost", "site_password": "admin"},
+            "database": {"name": "test_db", "user": "frappe", "password": "secret"},
+            "bench": {"path": "/opt/bench"},
+        }))
+
+        result = CliRunner().invoke(main, ["new-site", "--config", str(config_file)], input="")
+
+        assert result.exit_code == 0, result.output
+        (kwargs,) = captured
+        assert kwargs["config"].bench.path == "/opt/bench"
+        assert kwargs["bench_path"] is None
+        assert (kwargs["site_name"], kwargs["db_name"]) == ("test.localhost", "test_db")
+
+    def test_missing_values_prompted(self, captured):
+        """Test that values missing from options and config are prompted for."""
+        result = CliRunner().invoke(
+            main,
+            ["new-site", "--site-name", "test.localhost", "--db-user", "frappe"],
+            input="admin\nadmin\n\n\ntest_db\nsecret\n",
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Site name" not in result.output
+        assert "Database user" not in result.output
+        (kwargs,) = captured
+        assert kwargs["admin_password"] == "admin"
+        assert kwargs["db_name"] == "test_db"
+        assert kwargs["db_password"] == "secret"
+        assert (kwargs["db_host"], kwargs["db_port"]) == ("localhost", 5432)
+        assert kwargs["bench_path"] == "./frappe-bench"
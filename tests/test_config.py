@@ -1,12 +1,20 @@
 """Tests for configuration schema and loader."""
 
 import json
-import tempfile
-from pathlib import Path
+import os
+from importlib import resources
 
 import pytest
 
+from realtimex_frappe import data as data_package
+from realtimex_frappe.config import env, loader
+from realtimex_frappe.config.env import (
+    clear_env_cache,
+    config_from_environment,
+    get_missing_required_env_vars,
+)
 from realtimex_frappe.config.loader import (
+    clear_config_cache,
     get_default_config,
     load_config,
     merge_config_with_cli,
@@ -56,10 +64,19 @@ class TestRealtimexConfig:
         with pytest.raises(ValueError):
             DatabaseConfig(port=70000)
 
+        # Range boundaries
+        assert DatabaseConfig(port=1).port == 1
+        assert DatabaseConfig(port=65535).port == 65535
+
+        for port in (-1, 65536):
+            with pytest.raises(ValueError):
+                DatabaseConfig(port=port)
+
     def test_supabase_host(self):
         """Test that Supabase hosts are accepted."""
         db = DatabaseConfig(host="db.abcdef.supabase.co")
         assert db.host == "db.abcdef.supabase.co"
+        assert DatabaseConfig(host=" db.abcdef.supabase.co\n").host == "db.abcdef.supabase.co"
 
     def test_with_overrides(self):
         """Test configuration override."""
@@ -80,34 +97,102 @@ class TestRealtimexConfig:
         # Original should be unchanged
         assert config.site.name is None
 
+    def test_with_overrides_validates_changed_sections(self):
+        """Test that overridden values are still validated."""
+        config = RealtimexConfig()
+
+        overridden = config.with_overrides(db_host="  db.example.com  ")
+
+        assert overridden.database.host == "db.example.com"
+
+        # Unchanged sections are copies, not shared with the original
+        overridden.redis.cache_port = 1
+        assert config.redis.cache_port == 13001
+
+        with pytest.raises(ValueError):
+            config.with_overrides(db_port=70000)
+
 
 class TestConfigLoader:
     """Tests for configuration loading and saving."""
 
-    def test_write_and_load_config(self):
+    def test_write_and_load_config(self, tmp_path):
         """Test writing and loading a config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "test-config.json"
+        config_path = tmp_path / "test-config.json"
+
+        # Write default config
+        write_default_config(config_path)
+
+        # Verify file exists
+        assert config_path.exists()
+
+        # Load it back
+        loaded = load_config(config_path)
+
+        # Should use RealTimeX repos from bundled config
+        assert "realtimex" in loaded.frappe.branch
+        assert len(loaded.apps) == 1
+        assert loaded.apps[0].name == "erpnext"
 
-            # Write default config
-            write_default_config(config_path)
+    def test_load_config_is_cached_until_file_changes(self, tmp_path):
+        """Test that reloading an unchanged file reuses the parsed config."""
+        config_path = tmp_path / "cached-config.json"
+        write_default_config(config_path)
+        clear_config_cache()
 
-            # Verify file exists
-            assert config_path.exists()
+        first = load_config(config_path)
 
-            # Load it back
-            loaded = load_config(config_path)
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("unchanged file should not be re-parsed")
 
-            # Should use RealTimeX repos from bundled config
-            assert "realtimex" in loaded.frappe.branch
-            assert len(loaded.apps) == 1
-            assert loaded.apps[0].name == "erpnext"
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(RealtimexConfig, "model_validate_json", fail_parse)
+            second = load_config(config_path)
+
+        # Each call gets its own copy of the cached config
+        assert second == first
+        second.site.name = "mutated.localhost"
+        assert load_config(config_path).site.name is None
+
+        # Rewriting the file with different content invalidates the cache
+        data = json.loads(config_path.read_text())
+        data["site"]["name"] = "changed.localhost"
+        config_path.write_text(json.dumps(data, indent=4))
+
+        reloaded = load_config(config_path)
+        assert reloaded is not first
+        assert reloaded.site.name == "changed.localhost"
 
     def test_load_nonexistent_file(self):
         """Test loading a nonexistent file."""
         with pytest.raises(FileNotFoundError):
             load_config("/nonexistent/path/config.json")
 
+    def test_load_bundled_config_reuses_defaults(self):
+        """Test that loading the bundled file skips re-validation."""
+        bundled = resources.files(data_package).joinpath("default.json")
+
+        assert load_config(bundled) == get_default_config()
+
+    def test_get_default_config_is_cached(self):
+        """Test that the bundled defaults are parsed only once."""
+        get_default_config()
+        misses_before = loader._default_config.cache_info().misses
+
+        get_default_config()
+
+        assert loader._default_config.cache_info().misses == misses_before
+
+    def test_get_default_config_returns_independent_copies(self):
+        """Test that modifying one default config doesn't affect later calls."""
+        config = get_default_config()
+        config.redis.cache_port = 1
+        config.site.name = "mutated.localhost"
+
+        fresh = get_default_config()
+        assert fresh.redis.cache_port == 13001
+        assert fresh.site.name is None
+
     def test_get_default_config(self):
         """Test getting default config."""
         config = get_default_config()
@@ -145,6 +230,17 @@ class TestConfigLoader:
         assert len(merged.apps) == 1
         assert merged.apps[0].name == "erpnext"
 
+    def test_merge_without_cli_options(self):
+        """Test that a copy of the base config is returned when nothing is overridden."""
+        base = RealtimexConfig()
+
+        merged = merge_config_with_cli(base)
+        assert merged == base
+
+        merged.redis.cache_port = 1
+        assert base.redis.cache_port == 13001
+        assert merge_config_with_cli(None) == get_default_config()
+
 
 class TestAppConfig:
     """Tests for AppConfig model."""
@@ -171,6 +267,13 @@ class TestAppConfig:
         assert app.url == "https://github.com/myorg/erpnext-fork.git"
         assert app.branch == "custom-branch"
 
+    def test_app_config_is_frozen(self):
+        """Test that app entries can't be modified in place."""
+        app = AppConfig(name="erpnext", url="https://github.com/frappe/erpnext.git")
+
+        with pytest.raises(ValueError):
+            app.branch = "develop"
+
 
 class TestBundledConfigLoading:
     """Tests for bundled config loading (uvx/pip installation support)."""
@@ -190,29 +293,20 @@ class TestBundledConfigLoading:
         assert "therealtimex" in erpnext_app.url
         assert erpnext_app.url == "https://github.com/therealtimex/erpnext.git"
 
-    def test_get_default_config_works_from_any_directory(self):
+    def test_get_default_config_works_from_any_directory(self, tmp_path, monkeypatch):
         """Ensure config loading works regardless of current working directory.
 
         This reproduces the uvx failure where running from an arbitrary
         directory caused the config file to not be found.
         """
-        import os
-        import tempfile
-
-        original_cwd = os.getcwd()
-
-        try:
-            # Change to a completely unrelated directory
-            with tempfile.TemporaryDirectory() as tmpdir:
-                os.chdir(tmpdir)
+        # Change to a completely unrelated directory
+        monkeypatch.chdir(tmp_path)
 
-                # This should still work and return RealTimeX repos
-                config = get_default_config()
+        # This should still work and return RealTimeX repos
+        config = get_default_config()
 
-                assert "therealtimex" in config.frappe.repo
-                assert len(config.apps) >= 1
-        finally:
-            os.chdir(original_cwd)
+        assert "therealtimex" in config.frappe.repo
+        assert len(config.apps) >= 1
 
     def test_bundled_config_not_using_upstream_fallback(self):
         """Ensure we're not hitting hardcoded upstream fallback."""
@@ -225,3 +319,98 @@ class TestBundledConfigLoading:
                 assert app.url != "https://github.com/frappe/erpnext.git"
                 assert app.branch != "version-15"
 
+
+class TestConfigFromEnvironment:
+    """Tests for environment variable configuration."""
+
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        """Start each test without REALTIMEX_* variables or cached results."""
+        for name in list(os.environ):
+            if name.startswith("REALTIMEX_"):
+                monkeypatch.delenv(name)
+        clear_env_cache()
+        yield
+        clear_env_cache()
+
+    def test_reads_environment(self, monkeypatch):
+        """Test that environment variables populate the config."""
+        monkeypatch.setenv("REALTIMEX_MODE", "user")
+        monkeypatch.setenv("REALTIMEX_SITE_NAME", "env.localhost")
+        monkeypatch.setenv("REALTIMEX_DB_PORT", "6543")
+
+        config = config_from_environment()
+
+        assert config.mode.value == "user"
+        assert config.site.name == "env.localhost"
+        assert config.database.port == 6543
+
+    def test_zero_port_keeps_default(self, monkeypatch):
+        """Test that a port of 0 is treated as unset rather than rejected."""
+        monkeypatch.setenv("REALTIMEX_PORT", "0")
+        monkeypatch.setenv("REALTIMEX_DB_PORT", "0")
+
+        config = config_from_environment()
+
+        assert config.bench.port == get_default_config().bench.port
+        assert config.database.port == get_default_config().database.port
+
+    def test_nested_and_invalid_values(self, monkeypatch):
+        """Test nested field overrides and that blank/invalid values are ignored."""
+        monkeypatch.setenv("REALTIMEX_NODE_BIN_DIR", " /opt/node/bin ")
+        monkeypatch.setenv("REALTIMEX_REDIS_CACHE_PORT", "not-a-port")
+        monkeypatch.setenv("REALTIMEX_DB_HOST", "   ")
+
+        config = config_from_environment()
+
+        assert str(config.binaries.node.bin_dir) == "/opt/node/bin"
+        assert config.redis.cache_port == 13001
+        assert config.database.host == "localhost"
+
+    def test_boolean_values(self, monkeypatch):
+        """Test boolean spellings and that ambiguous values are rejected."""
+        monkeypatch.setenv("REALTIMEX_DEVELOPER_MODE", "Off")
+        monkeypatch.setenv("REALTIMEX_FORCE_REINSTALL", "YES")
+
+        config = config_from_environment()
+
+        assert config.bench.developer_mode is False
+        assert config.force_reinstall is True
+
+        monkeypatch.setenv("REALTIMEX_FORCE_REINSTALL", "maybe")
+        with pytest.raises(ValueError, match="REALTIMEX_FORCE_REINSTALL"):
+            config_from_environment()
+
+    def test_result_is_cached(self, monkeypatch):
+        """Test that repeated calls reuse the built config without sharing it."""
+        monkeypatch.setenv("REALTIMEX_SITE_NAME", "cached.localhost")
+        first = config_from_environment()
+        misses_before = env._config_from_snapshot.cache_info().misses
+
+        first.site.name = "mutated.localhost"
+        second = config_from_environment()
+
+        assert env._config_from_snapshot.cache_info().misses == misses_before
+        assert second.site.name == "cached.localhost"
+
+    def test_cache_invalidated_on_env_change(self, monkeypatch):
+        """Test that changing a REALTIMEX_* variable yields a fresh config."""
+        monkeypatch.setenv("REALTIMEX_SITE_NAME", "first.localhost")
+        first = config_from_environment()
+
+        monkeypatch.setenv("REALTIMEX_SITE_NAME", "second.localhost")
+        second = config_from_environment()
+
+        assert first.site.name == "first.localhost"
+        assert second.site.name == "second.localhost"
+
+    def test_missing_required_env_vars(self, monkeypatch):
+        """Test detection of missing required variables per mode."""
+        assert "REALTIMEX_MODE" in get_missing_required_env_vars()
+
+        monkeypatch.setenv("REALTIMEX_MODE", "admin")
+        missing = get_missing_required_env_vars()
+
+        assert "REALTIMEX_MODE" not in missing
+        assert "REALTIMEX_DB_SCHEMA" in missing
+        assert "REALTIMEX_ADMIN_DB_PASSWORD" in missing
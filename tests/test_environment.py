@@ -0,0 +1,247 @@
+"""Tests for bundled binary environment utilities."""
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from realtimex_frappe.config.schema import RealtimexConfig
+from realtimex_frappe.utils import environment
+from realtimex_frappe.utils.environment import (
+    VALIDATION_STAMP_FILE,
+    build_environment,
+    clear_binary_cache,
+    get_binary_path,
+    validate_all_prerequisites,
+    validate_binaries,
+    validate_binaries_bulk,
+)
+
+
+def make_executable(directory: Path, name: str) -> Path:
+    """Create an empty executable file in the given directory."""
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return path
+
+
+@pytest.fixture
+def node_config(tmp_path):
+    """Config whose Node.js bin_dir contains a fake node binary."""
+    clear_binary_cache()
+    make_executable(tmp_path, "node")
+
+    config = RealtimexConfig()
+    config.binaries.node.bin_dir = tmp_path
+    yield config
+    clear_binary_cache()
+
+
+class TestBinaryLookup:
+    """Tests for binary resolution through bundled bin directories."""
+
+    def test_build_environment_prepends_bin_dir(self, node_config, tmp_path):
+        """Test that the bundled bin_dir comes first on PATH."""
+        env = build_environment(node_config)
+
+        assert env["PATH"].split(os.pathsep)[0] == str(tmp_path.resolve())
+
+    def test_build_environment_returns_fresh_copy(self, node_config):
+        """Test that callers can modify the environment without side effects."""
+        env = build_environment(node_config)
+        env["REALTIMEX_TEST_ONLY"] = "1"
+
+        assert "REALTIMEX_TEST_ONLY" not in build_environment(node_config)
+
+    def test_build_environment_reads_live_environment(self, node_config, monkeypatch):
+        """Test that variables set after the first build are passed through."""
+        build_environment(node_config)
+        monkeypatch.setenv("REALTIMEX_TEST_ONLY", "1")
+
+        assert build_environment(node_config)["REALTIMEX_TEST_ONLY"] == "1"
+
+    def test_bin_dir_resolved_once(self, node_config):
+        """Test that repeated environment builds reuse the resolved bin_dir."""
+        build_environment(node_config)
+        misses_before = environment._resolve_bin_dir.cache_info().misses
+
+        build_environment(node_config)
+        get_binary_path("node", node_config)
+
+        assert environment._resolve_bin_dir.cache_info().misses == misses_before
+
+    def test_bin_dir_created_later_is_used(self, node_config, tmp_path):
+        """Test that a bin_dir missing on first use is added once it exists."""
+        bin_dir = tmp_path / "later"
+        node_config.binaries.wkhtmltopdf.bin_dir = bin_dir
+        build_environment(node_config)
+
+        bin_dir.mkdir()
+
+        assert str(bin_dir.resolve()) in build_environment(node_config)["PATH"].split(os.pathsep)
+
+    def test_get_binary_path_uses_bin_dir(self, node_config, tmp_path):
+        """Test that binaries in the bundled bin_dir are found."""
+        path = get_binary_path("node", node_config)
+
+        assert path == str(tmp_path.resolve() / "node")
+
+    def test_validate_binaries(self, node_config):
+        """Test splitting binaries into available and missing."""
+        result = validate_binaries(node_config, ["node", "definitely-not-a-binary"])
+
+        assert result.available == ["node"]
+        assert result.missing == ["definitely-not-a-binary"]
+        assert not result.is_valid
+
+    def test_validate_binaries_bulk(self, node_config):
+        """Test required and optional results from one resolution pass."""
+        required, optional = validate_binaries_bulk(
+            node_config, ["node"], ["definitely-not-a-binary"]
+        )
+
+        assert required.is_valid
+        assert required.available == ["node"]
+        assert optional.missing == ["definitely-not-a-binary"]
+
+    def test_lookups_are_memoized(self, node_config):
+        """Test that repeated lookups hit the cache instead of PATH."""
+        get_binary_path("node", node_config)
+        hits_before = environment._which_on_path.cache_info().hits
+
+        get_binary_path("node", node_config)
+        validate_binaries(node_config, ["node"])
+
+        assert environment._which_on_path.cache_info().hits == hits_before + 2
+
+    def test_each_path_directory_listed_once(self, node_config):
+        """Test that resolving several binaries lists each PATH entry once."""
+        search_path = environment._search_path(node_config)
+
+        validate_binaries(node_config, ["node", "npm", "definitely-not-a-binary"])
+
+        directories = set(search_path.split(os.pathsep))
+        assert environment._dir_entries.cache_info().misses <= len(directories)
+
+    def test_relative_path_entry_resolved_against_cwd(self, tmp_path, monkeypatch):
+        """Test that relative PATH entries follow chdir and yield absolute paths."""
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        make_executable(first, "tool")
+        make_executable(second, "tool")
+
+        monkeypatch.chdir(first)
+        assert environment._which("tool", os.curdir) == str(first / "tool")
+        monkeypatch.chdir(second)
+        assert environment._which("tool", os.curdir) == str(second / "tool")
+
+    def test_validate_all_prerequisites_uses_bundled_dirs(self, node_config, tmp_path):
+        """Test that system prerequisites are also found in bundled bin dirs."""
+        make_executable(tmp_path, "npm")
+        make_executable(tmp_path, "wkhtmltopdf")
+
+        system_result, binaries_result = validate_all_prerequisites(node_config)
+
+        assert "wkhtmltopdf" in system_result.available
+        assert "wkhtmltopdf" not in system_result.missing_required
+        assert binaries_result.is_valid
+
+
+class TestValidationStamp:
+    """Tests for persisting validation results across runs."""
+
+    @pytest.fixture
+    def bundled_config(self, node_config, tmp_path):
+        """Config with every required binary available in the bundled dir."""
+        for name in ("npm", "git", "pkg-config", "wkhtmltopdf", "redis-server"):
+            make_executable(tmp_path, name)
+        return node_config
+
+    def test_stamp_written_after_successful_validation(self, bundled_config, tmp_path):
+        """Test that a passing validation records a stamp."""
+        stamp_file = tmp_path / VALIDATION_STAMP_FILE
+
+        system_result, binaries_result = validate_all_prerequisites(bundled_config, stamp_file)
+
+        assert system_result.is_valid and binaries_result.is_valid
+        assert "node" in json.loads(stamp_file.read_text())["binaries"]
+
+    def test_stamp_reused_without_path_scan(self, bundled_config, tmp_path, monkeypatch):
+        """Test that a matching stamp skips binary resolution."""
+        stamp_file = tmp_path / VALIDATION_STAMP_FILE
+        validate_all_prerequisites(bundled_config, stamp_file)
+
+        def fail_resolve(*args, **kwargs):
+            raise AssertionError("PATH should not be scanned")
+
+        monkeypatch.setattr(environment, "resolve_binaries", fail_resolve)
+        system_result, binaries_result = validate_all_prerequisites(bundled_config, stamp_file)
+
+        assert system_result.is_valid and binaries_result.is_valid
+
+    def test_stamp_invalidated_when_binary_changes(self, bundled_config, tmp_path):
+        """Test that a changed binary mtime forces a fresh validation."""
+        stamp_file = tmp_path / VALIDATION_STAMP_FILE
+        validate_all_prerequisites(bundled_config, stamp_file)
+
+        node = tmp_path / "node"
+        st = node.stat()
+        os.utime(node, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        search_path = environment._search_path(bundled_config)
+        inputs_hash = environment._hash_inputs(bundled_config, search_path)
+        assert environment._paths_from_stamp(stamp_file, inputs_hash, search_path, ["node"]) is None
+
+    def test_stamp_invalidated_when_config_changes(self, bundled_config, tmp_path, monkeypatch):
+        """Test that changed settings force a fresh validation."""
+        stamp_file = tmp_path / VALIDATION_STAMP_FILE
+        validate_all_prerequisites(bundled_config, stamp_file)
+        bundled_config.site.name = "other.localhost"
+
+        calls = []
+        resolve = environment.resolve_binaries
+        monkeypatch.setattr(
+            environment, "resolve_binaries", lambda *args: calls.append(args) or resolve(*args)
+        )
+        validate_all_prerequisites(bundled_config, stamp_file)
+
+        assert calls
+
+    def test_force_reinstall_discards_stamp(self, bundled_config, tmp_path, monkeypatch):
+        """Test that force_reinstall revalidates instead of trusting the stamp."""
+        stamp_file = tmp_path / VALIDATION_STAMP_FILE
+        validate_all_prerequisites(bundled_config, stamp_file)
+        bundled_config.force_reinstall = True
+
+        calls = []
+        monkeypatch.setattr(
+            environment, "resolve_binaries", lambda *args: calls.append(args) or dict.fromkeys(args[1])
+        )
+        validate_all_prerequisites(bundled_config, stamp_file)
+
+        assert calls
+        assert not stamp_file.exists()
+
+    @pytest.mark.parametrize(
+        "stamp",
+        [
+            [],
+            {"binaries": []},
+            {"binaries": {"node": "/usr/bin/node"}},
+            {"binaries": {"node": ["/usr/bin/node"]}},
+        ],
+    )
+    def test_malformed_stamp_treated_as_stale(self, bundled_config, tmp_path, stamp):
+        """Test that a structurally invalid stamp is ignored rather than raising."""
+        search_path = environment._search_path(bundled_config)
+        inputs_hash = environment._hash_inputs(bundled_config, search_path)
+        if isinstance(stamp, dict):
+            stamp.setdefault("inputs_hash", inputs_hash)
+        stamp_file = tmp_path / VALIDATION_STAMP_FILE
+        stamp_file.write_text(json.dumps(stamp))
+
+        assert environment._paths_from_stamp(stamp_file, inputs_hash, search_path, ["node"]) is None
@@ -0,0 +1,93 @@
+"""Tests for the unified run command."""
+
+import socket
+import subprocess
+import time
+
+import pytest
+
+from realtimex_frappe.commands import run
+from realtimex_frappe.config.schema import AppConfig, RealtimexConfig, RunMode
+from realtimex_frappe.utils.environment import (
+    BinaryValidationResult,
+    PrerequisiteValidationResult,
+)
+
+
+class TestRunSetupAndStart:
+    """Tests for run_setup_and_start()."""
+
+    def test_fails_fast_when_bench_exits(self, tmp_path, monkeypatch):
+        """Test that a bench crashing during app install aborts without waiting out the timeout."""
+        with socket.socket() as server:
+            # Bound but not listening, so the readiness probe is refused
+            server.bind(("127.0.0.1", 0))
+            port = server.getsockname()[1]
+
+            config = RealtimexConfig(
+                mode=RunMode.ADMIN,
+                apps=[AppConfig(name="erpnext", url="https://example.com/erpnext.git")],
+            ).with_overrides(site_name="test.localhost", bench_path=str(tmp_path))
+            config.bench.port = port
+
+            monkeypatch.setattr(run, "validate_all_prerequisites", lambda config, stamp_file: (
+                PrerequisiteValidationResult(["git"], [], []),
+                BinaryValidationResult(["node"], []),
+            ))
+            monkeypatch.setattr(run, "bench_exists", lambda config: True)
+            monkeypatch.setattr(run, "update_common_site_config", lambda config: None)
+            monkeypatch.setattr(run, "get_all_apps", lambda config: True)
+            monkeypatch.setattr(run, "site_is_healthy", lambda config: (False, "not_found"))
+            monkeypatch.setattr(run, "create_site", lambda config, force=False: True)
+            monkeypatch.setattr(run, "site_missing_apps", lambda config: ["erpnext"])
+            monkeypatch.setattr(
+                run,
+                "run_bench_start_subprocess",
+                lambda config: subprocess.Popen(["false"], start_new_session=True),
+            )
+            monkeypatch.setattr(run, "install_apps_on_site", lambda config, app_names: pytest.fail("bench never started"))
+            monkeypatch.setattr(run, "start_bench", lambda config: pytest.fail("bench never started"))
+
+            start = time.monotonic()
+            with pytest.raises(SystemExit) as excinfo:
+                run.run_setup_and_start(config)
+
+            assert excinfo.value.code == 1
+            assert time.monotonic() - start < 10
+
+    def test_skips_temporary_bench_when_apps_installed(self, tmp_path, monkeypatch):
+        """Test that a healthy site with every app installed starts bench directly."""
+        config = RealtimexConfig(
+            mode=RunMode.ADMIN,
+            apps=[AppConfig(name="erpnext", url="https://example.com/erpnext.git")],
+        ).with_overrides(site_name="test.localhost", bench_path=str(tmp_path))
+        started = []
+
+        monkeypatch.setattr(run, "validate_all_prerequisites", lambda config, stamp_file: (
+            PrerequisiteValidationResult(["git"], [], []),
+            BinaryValidationResult(["node"], []),
+        ))
+        monkeypatch.setattr(run, "bench_exists", lambda config: True)
+        monkeypatch.setattr(run, "update_common_site_config", lambda config: None)
+        monkeypatch.setattr(run, "get_all_apps", lambda config: True)
+        monkeypatch.setattr(run, "site_is_healthy", lambda config: (True, "healthy"))
+        monkeypatch.setattr(run, "site_missing_apps", lambda config: [])
+        monkeypatch.setattr(
+            run, "run_bench_start_subprocess", lambda config: pytest.fail("no temporary bench needed")
+        )
+        monkeypatch.setattr(run, "start_bench", started.append)
+
+        run.run_setup_and_start(config)
+
+        assert started == [config]
+
+    def test_invalid_setting_exits_cleanly(self, monkeypatch, capsys):
+        """Test that an unparseable environment value is reported without a traceback."""
+        monkeypatch.setattr(run, "get_missing_required_env_vars", lambda: [])
+        monkeypatch.setenv("REALTIMEX_DEVELOPER_MODE", "maybe")
+
+        with pytest.raises(SystemExit) as excinfo:
+            run.run_setup_and_start()
+
+        assert excinfo.value.code == 1
+        assert "REALTIMEX_DEVELOPER_MODE" in capsys.readouterr().out